@@ -1,8 +1,30 @@
-import copy
 from pprint import pprint
+import array
+import bisect
+import heapq
+import io
+import itertools
+import json
+import contextlib
+import math
+import mmap
+import multiprocessing
+import os
+import pickle
+import random
+import struct
+import sys
+import time
+import tracemalloc
 import uuid
 from uuid import UUID
-from collections import deque
+from collections import OrderedDict, deque
+from collections.abc import Callable, Iterable, Iterator, Sequence
+
+try:
+    import numpy as np
+except ImportError:  # numpy 백엔드(candidate_backend="numpy")를 사용할 때만 필요
+    np = None
 
 class AssemblyType:
     """조립부 종류를 나타내는 클래스
@@ -12,7 +34,8 @@ class AssemblyType:
     조립 가능 여부를 판단하는 기준이 됩니다.
     
     Attributes:
-        assembled_flag (bool): 해당 타입이 조립에 사용되었는지 여부
+        assembled_flag (bool): State 생성 시점에 해당 타입이 이미 조립에 사용되었는지 여부
+            (탐색 중 상태별 조립 여부는 State.assembled_mask로 관리)
         parent_item (Item): 이 타입을 소유한 부품 객체
         main_type (str): 주 타입 (예: 'A', 'B', 'C')
         sub_type (str): 부 타입 (예: 'm', 'f', 'i')
@@ -69,13 +92,14 @@ class Item:
         type_list (list[AssemblyType]): 부품이 가진 조립부 타입 리스트
     """
     
-    def __init__(self, name_arg: str = "") -> None:
+    def __init__(self, name_arg: str = "", uuid_arg: UUID | None = None) -> None:
         """Item 초기화
         
         Args:
             name_arg: 부품 이름 (기본값: "")
+            uuid_arg: 부품 고유 식별자 (기본값: None이면 uuid.uuid4()로 생성)
         """
-        self.uuid: UUID = uuid.uuid4()  # 고유 식별자 생성
+        self.uuid: UUID = uuid.uuid4() if uuid_arg is None else uuid_arg  # 고유 식별자 생성
         self.name: str = name_arg
         self.type_list: list[AssemblyType] = []
     
@@ -123,11 +147,13 @@ class AssemblyGroupDataBase:
     
     Attributes:
         assembly_group_data (dict): {main_type: [sub_type 리스트]} 형태의 조립 그룹 데이터
+        revision (int): 조립 그룹이 추가될 때마다 증가하는 변경 번호 (후보 캐시 무효화용)
     """
     
     def __init__(self) -> None:
         """AssemblyGroupDataBase 초기화"""
         self.assembly_group_data: dict[str, list[str]] = {}
+        self.revision: int = 0
 
     def add_assembly_type_group(self, assembly_type_group: list[AssemblyType]) -> None:
         """조립 가능한 타입 그룹을 추가합니다
@@ -150,6 +176,7 @@ class AssemblyGroupDataBase:
                 sub_type_list.append(sub_type)
             
             self.assembly_group_data.update({group_type: sub_type_list})
+            self.revision += 1
 
     def get_assembly_group_data(self, main_type: str) -> list[str]:
         """특정 main_type에 대한 조립 가능한 sub_type 리스트를 반환합니다
@@ -202,347 +229,3400 @@ class AssemblyGroupDataBase:
                 return False
 
 
-class State:
-    """시스템의 전체 상태를 나타내는 클래스
+class StateLayout:
+    """State들이 공유하는 불변 부품 구조
     
-    모든 부품(Item)의 현재 상태를 하나의 객체로 관리합니다.
-    Planning 시스템이 개별 아이템이 아닌 전체 상태를 기반으로 
-    의사결정을 할 수 있도록 합니다.
+    부품(Item)과 조립부 타입(AssemblyType)의 구성은 조립이 진행되어도 변하지 않으므로,
+    초기 상태에서 한 번만 만들고 모든 파생 State가 같은 객체를 참조합니다.
+    각 조립부에는 부품 순서, 타입 순서대로 고유한 비트 위치(port)가 부여되며,
+    State는 이 비트 위치를 이용해 조립 여부를 정수 비트마스크로 표현합니다.
+    
+    main_type, sub_type 문자열은 처음 등장한 순서대로 정수 id로 변환(intern)되며,
+    탐색 엔진은 문자열 대신 이 정수 id와 조립부별 평탄한 리스트만 사용합니다.
     
     Attributes:
-        item_state_list (list[Item]): 현재 상태의 부품 리스트
-        action_sequence_log (list[list[tuple[UUID, int]]]): 조립 과정 로그
+        item_list (list[Item]): 부품 리스트
+        item_index_dict (dict[UUID, int]): 부품 UUID -> 부품 인덱스
+        port_offset_list (list[int]): 각 부품의 첫 번째 조립부 비트 위치
+        port_count (int): 전체 조립부 개수
+        main_type_name_list (list[str]): main_type id -> main_type 문자열
+        main_type_id_dict (dict[str, int]): main_type 문자열 -> main_type id
+        sub_type_name_list (list[str]): sub_type id -> sub_type 문자열
+        sub_type_id_dict (dict[str, int]): sub_type 문자열 -> sub_type id
+        port_item_list (list[int]): 비트 위치 -> 부품 인덱스
+        port_type_index_list (list[int]): 비트 위치 -> 조립부 타입 인덱스
+        port_main_type_list (list[int]): 비트 위치 -> main_type id (조립 그룹 id)
+        port_sub_type_list (list[int]): 비트 위치 -> sub_type id
+        port_index (list[dict[int, list[int]]]): 
+            main_type id -> sub_type id -> [비트 위치, ...] 형태의 전체 조립부 색인
+        compiled_problem (CompiledProblem | None): 마지막으로 컴파일한 조립 규칙 테이블
+        candidate_backend (str): check_candidate_match의 기본 후보 탐색 백엔드 ("python" 또는 "numpy")
+        snapshot_init_mask (int | None): 
+            스냅샷(load_problem_snapshot)에서 불러온 초기 조립부 비트마스크 (스냅샷이 아니면 None)
+        symmetric_item_group_list (list[tuple[int, ...]] | None): 
+            조립부 구성이 같아 서로 바꿀 수 있는 부품 인덱스 묶음 리스트 (처음 사용할 때 생성)
     """
     
     def __init__(self, item_list: list[Item]) -> None:
-        """State 초기화
+        """StateLayout 초기화
         
         Args:
             item_list: Item 객체들의 리스트
         """
-        self.item_state_list: list[Item] = item_list.copy()
-        self.action_sequence_log: list[list[tuple[UUID, int]]] = []
+        self.item_list: list[Item] = item_list.copy()
+        self.item_index_dict: dict[UUID, int] = {}
+        self.port_offset_list: list[int] = []
+        self.main_type_name_list: list[str] = []
+        self.main_type_id_dict: dict[str, int] = {}
+        self.sub_type_name_list: list[str] = []
+        self.sub_type_id_dict: dict[str, int] = {}
+        self.port_item_list: list[int] = []
+        self.port_type_index_list: list[int] = []
+        self.port_main_type_list: list[int] = []
+        self.port_sub_type_list: list[int] = []
+        self.port_index: list[dict[int, list[int]]] = []
+        self.compiled_problem: CompiledProblem | None = None
+        self.candidate_backend: str = "python"
+        self.snapshot_init_mask: int | None = None
+        self.symmetric_item_group_list: list[tuple[int, ...]] | None = None
+        
+        port_count: int = 0
+        for item_index, item in enumerate(self.item_list):
+            self.item_index_dict[item.get_uuid()] = item_index
+            self.port_offset_list.append(port_count)
+            for assembly_type_index, assembly_type in enumerate(item.get_type_list()):
+                main_type, sub_type = assembly_type.get_type()
+                main_type_id: int = self.intern_main_type(main_type)
+                sub_type_id: int = self.intern_sub_type(sub_type)
+                self.port_item_list.append(item_index)
+                self.port_type_index_list.append(assembly_type_index)
+                self.port_main_type_list.append(main_type_id)
+                self.port_sub_type_list.append(sub_type_id)
+                self.port_index[main_type_id].setdefault(sub_type_id, []).append(port_count)
+                port_count += 1
+        self.port_count: int = port_count
 
-    def get_item_state_list(self) -> list[Item]:
-        """부품 상태 리스트를 반환합니다"""
-        return self.item_state_list
+    def intern_main_type(self, main_type: str) -> int:
+        """main_type 문자열의 정수 id를 반환합니다 (처음 보는 문자열이면 새 id 부여)"""
+        main_type_id: int | None = self.main_type_id_dict.get(main_type)
+        if main_type_id is None:
+            main_type_id = len(self.main_type_name_list)
+            self.main_type_id_dict[main_type] = main_type_id
+            self.main_type_name_list.append(main_type)
+            self.port_index.append({})
+        return main_type_id
 
-    def loging_action_sequence(self, match_set_info: list[tuple[UUID, int]]) -> None:
-        """조립 액션을 로그에 기록합니다
+    def intern_sub_type(self, sub_type: str) -> int:
+        """sub_type 문자열의 정수 id를 반환합니다 (처음 보는 문자열이면 새 id 부여)"""
+        sub_type_id: int | None = self.sub_type_id_dict.get(sub_type)
+        if sub_type_id is None:
+            sub_type_id = len(self.sub_type_name_list)
+            self.sub_type_id_dict[sub_type] = sub_type_id
+            self.sub_type_name_list.append(sub_type)
+        return sub_type_id
+
+    def get_compiled_problem(self, assembly_data_base: AssemblyGroupDataBase) -> 'CompiledProblem':
+        """조립 규칙 데이터베이스를 이 부품 구조의 정수 id 테이블로 컴파일합니다
+        
+        같은 데이터베이스가 변경(revision 증가)되지 않았다면 이전 결과를 재사용합니다.
         
         Args:
-            match_set_info: 조립된 부품들의 (UUID, assembly_type_index) 정보
+            assembly_data_base: 조립 규칙 데이터베이스
+            
+        Returns:
+            컴파일된 조립 문제
         """
-        self.action_sequence_log.append(match_set_info)
+        compiled_problem: CompiledProblem | None = self.compiled_problem
+        if (compiled_problem is None or compiled_problem.assembly_data_base is not assembly_data_base
+                or compiled_problem.revision != assembly_data_base.revision):
+            compiled_problem = CompiledProblem(self, assembly_data_base)
+            self.compiled_problem = compiled_problem
+        return compiled_problem
 
-    def get_action_sequence_log(self) -> list[list[tuple[UUID, int]]]:
-        """조립 과정 로그를 반환합니다"""
-        return self.action_sequence_log
+    def get_item_index(self, item_uuid: UUID) -> int:
+        """부품 UUID에 해당하는 부품 인덱스를 반환합니다"""
+        return self.item_index_dict[item_uuid]
 
+    def get_item_by_uuid(self, item_uuid: UUID) -> Item:
+        """부품 UUID에 해당하는 Item 객체를 반환합니다"""
+        return self.item_list[self.item_index_dict[item_uuid]]
 
-def check_candidate_match(state_arg: State, assembly_data_base: AssemblyGroupDataBase) -> list[list[tuple[UUID, int]]]:
-    """현재 상태에서 가능한 조립 후보들을 탐색합니다
-    
-    주어진 상태(State)에서 조립 가능한 AssemblyType 조합들을 찾습니다.
-    각 조합은 데이터베이스의 조립 규칙을 만족해야 합니다.
-    
-    Args:
-        state_arg: 현재 시스템 상태
-        assembly_data_base: 조립 규칙 데이터베이스
+    def get_port_bit(self, item_uuid: UUID, assembly_type_index: int) -> int:
+        """조립부의 비트 위치를 반환합니다"""
+        return self.port_offset_list[self.item_index_dict[item_uuid]] + assembly_type_index
+
+    def get_port_info(self, port_bit: int) -> tuple[UUID, int]:
+        """비트 위치에 해당하는 (부품 UUID, 조립부 타입 인덱스)를 반환합니다"""
+        return self.item_list[self.port_item_list[port_bit]].get_uuid(), self.port_type_index_list[port_bit]
+
+    def get_mask_main_type_set(self, port_mask: int) -> set[int]:
+        """비트마스크에 포함된 조립부들의 main_type id 집합을 반환합니다"""
+        main_type_set: set[int] = set()
+        while port_mask:
+            lowest_bit: int = port_mask & -port_mask
+            main_type_set.add(self.port_main_type_list[lowest_bit.bit_length() - 1])
+            port_mask ^= lowest_bit
+        return main_type_set
+
+    def get_match_mask(self, match_set_info: list[tuple[UUID, int]]) -> int:
+        """조립 정보에 포함된 조립부들의 비트마스크를 반환합니다
         
-    Returns:
-        조립 가능한 AssemblyType 조합들의 리스트
-        각 조합은 [(UUID, int), (UUID, int), ...] 형태
-    """
-    before_visit_item_list: list[Item] = state_arg.get_item_state_list().copy()
-    candidate_match_list: list[list[tuple[UUID, int]]] = []  # item uuid와 assembly_type_index를 통해 조립을 표현
+        Args:
+            match_set_info: (UUID, assembly_type_index) 리스트
+            
+        Returns:
+            해당 조립부 비트들이 켜진 정수
+        """
+        match_mask: int = 0
+        for item_uuid, assembly_type_index in match_set_info:
+            match_mask |= 1 << (self.port_offset_list[self.item_index_dict[item_uuid]] + assembly_type_index)
+        return match_mask
 
-    while len(before_visit_item_list) > 0:
-        # 검사할 부품 선택
-        anchor_item: Item = before_visit_item_list.pop()
-        anchor_item_uuid: UUID = anchor_item.get_uuid()
-        anchor_assembly_type_list: list[AssemblyType] = anchor_item.get_type_list()
+    def get_match_info(self, match_mask: int) -> list[tuple[UUID, int]]:
+        """조립부 비트마스크를 check_candidate_match와 같은 순서의 조립 정보로 변환합니다
         
-        for anchor_assembly_type_index, anchor_assembly_type in enumerate(anchor_assembly_type_list):
-            # 이미 조립에 사용된 타입은 건너뜀
-            if anchor_assembly_type.assembled_flag:
-                continue
-                
-            anchor_main_type, sub_type = anchor_assembly_type.get_type()
-            required_sub_type_list: list[str] = assembly_data_base.get_assembly_group_data(anchor_main_type)
+        조립 그룹의 조립부들은 서로 다른 부품에 있으므로 가장 높은 비트가 anchor이며,
+        나머지 조립부는 비트 위치 순으로 뒤따릅니다.
+        
+        Args:
+            match_mask: 하나의 조립에 사용된 조립부 비트마스크
+            
+        Returns:
+            (UUID, assembly_type_index) 리스트
+        """
+        port_bit_list: list[int] = [port_bit for port_bit in range(match_mask.bit_length()) if match_mask >> port_bit & 1]
+        return [self.get_port_info(port_bit) for port_bit in (port_bit_list[-1], *port_bit_list[:-1])]
 
-            if required_sub_type_list is not None and sub_type in required_sub_type_list:
-                # 조립 가능한 타입 그룹의 일부를 발견
-                candidate_assembly_info_list: list[tuple[UUID, int]] = [(anchor_item_uuid, anchor_assembly_type_index)]
-                acquired_sub_type_list: list[str] = [sub_type]
-                
-                # 나머지 부품들에서 조립 가능한 타입 찾기
-                for visiting_item in before_visit_item_list:
-                    visiting_item_uuid: UUID = visiting_item.get_uuid()
-                    visiting_item_assembly_type_list: list[AssemblyType] = visiting_item.get_type_list()
-                    
-                    for visiting_assembly_type_index, visiting_item_assembly_type in enumerate(visiting_item_assembly_type_list):
-                        if visiting_item_assembly_type.assembled_flag:
-                            # 이미 조립에 사용된 타입은 건너뜀
-                            continue
-                        
-                        visiting_main_type, visiting_sub_type = visiting_item_assembly_type.get_type()
-                        
-                        # 조립 가능 조건 확인:
-                        # 1. 같은 main_type
-                        # 2. required_sub_type에 포함됨
-                        # 3. 중복되지 않은 sub_type
-                        if (visiting_main_type == anchor_main_type
-                                and visiting_sub_type in required_sub_type_list
-                                and visiting_sub_type not in acquired_sub_type_list):
-                            
-                            candidate_assembly_info_list.append((visiting_item_uuid, visiting_assembly_type_index))
-                            acquired_sub_type_list.append(visiting_sub_type)
-                            # 한 아이템에서 하나의 타입만 추가
-                            break
-                
-                # 완전한 조립 그룹을 찾았는지 검증
-                candidate_assembly_type_list: list[AssemblyType] = []
-                for candidate_item_uuid, candidate_assembly_type_index in candidate_assembly_info_list:
-                    for item in state_arg.get_item_state_list():
-                        if item.get_uuid() == candidate_item_uuid:
-                            candidate_item = item
-                            break
-                    candidate_assembly_type_list.append(candidate_item.get_type_by_index(candidate_assembly_type_index))
-
-                if assembly_data_base.check_can_assemble(candidate_assembly_type_list):
-                    candidate_match_list.append(candidate_assembly_info_list)
+    def get_symmetric_item_group_list(self) -> list[tuple[int, ...]]:
+        """서로 바꿀 수 있는(대칭인) 부품 인덱스 묶음 리스트를 반환합니다
+        
+        조립 가능 여부는 조립부의 (main_type, sub_type)과 "서로 다른 부품"이라는 조건에만 의존하므로,
+        조립부 타입 순서대로의 (main_type id, sub_type id) 구성(조립부 시그니처)이 같은 부품들은
+        서로 바꾸어도 조립 가능한 조합과 조립 결과의 구조가 그대로 유지됩니다.
+        (예: 같은 조립부를 가진 bolt1, bolt2)
+        
+        Returns:
+            부품이 2개 이상인 묶음만 담은 [(부품 인덱스, ...), ...] (부품 인덱스 오름차순)
+        """
+        if self.symmetric_item_group_list is None:
+            item_count: int = len(self.port_offset_list)
+            signature_dict: dict[tuple[tuple[int, int], ...], list[int]] = {}
+            for item_index in range(item_count):
+                port_end: int = self.port_offset_list[item_index + 1] if item_index + 1 < item_count else self.port_count
+                signature: tuple[tuple[int, int], ...] = tuple(
+                    (self.port_main_type_list[port_bit], self.port_sub_type_list[port_bit])
+                    for port_bit in range(self.port_offset_list[item_index], port_end))
+                signature_dict.setdefault(signature, []).append(item_index)
+            self.symmetric_item_group_list = [tuple(item_index_list) for signature, item_index_list
+                                              in signature_dict.items() if len(item_index_list) > 1 and signature]
+        return self.symmetric_item_group_list
 
-    return candidate_match_list
+    def get_canonical_mask(self, assembled_mask: int) -> int:
+        """대칭인 부품끼리의 자리 바꿈을 무시한 대표 비트마스크를 반환합니다
+        
+        대칭인 부품 묶음마다 부품별 조립부 비트들(부분 마스크)을 내림차순으로 정렬해
+        묶음의 부품 순서대로 다시 배치합니다. 부품을 서로 바꾸기만 한 상태들은
+        모두 같은 대표 비트마스크를 가지며, 대표 비트마스크 역시 실제로 도달 가능한 상태입니다.
+        
+        Args:
+            assembled_mask: 조립부 비트마스크
+            
+        Returns:
+            대표 비트마스크 (대칭인 부품이 없으면 assembled_mask 그대로)
+        """
+        for item_index_tuple in self.get_symmetric_item_group_list():
+            item_port_count: int = (self.port_offset_list[item_index_tuple[0] + 1]
+                                    if item_index_tuple[0] + 1 < len(self.port_offset_list)
+                                    else self.port_count) - self.port_offset_list[item_index_tuple[0]]
+            item_port_mask: int = (1 << item_port_count) - 1
+            sub_mask_list: list[int] = []
+            for item_index in item_index_tuple:
+                port_offset: int = self.port_offset_list[item_index]
+                sub_mask_list.append(assembled_mask >> port_offset & item_port_mask)
+                assembled_mask &= ~(item_port_mask << port_offset)
+            sub_mask_list.sort(reverse=True)
+            for item_index, sub_mask in zip(item_index_tuple, sub_mask_list):
+                assembled_mask |= sub_mask << self.port_offset_list[item_index]
+        return assembled_mask
 
 
-def execute_assemble(state_arg: State, match_set_info_arg: list[tuple[UUID, int]]) -> State:
-    """조립을 실행합니다
+class CompiledProblem:
+    """정수 id 테이블로 컴파일된 조립 문제
     
-    조립 가능한 타입들의 assembled_flag를 True로 설정하여
-    해당 타입들이 조립에 사용되었음을 표시합니다.
+    부품 구조(StateLayout)의 조립부 테이블에 조립 규칙 데이터베이스를 결합하여,
+    조립 그룹(main_type id)마다 필요한 sub_type id 구성을 평탄한 리스트로 저장합니다.
+    탐색 엔진은 문자열 비교나 리스트 포함 검사 없이 이 테이블만 조회합니다.
     
-    Args:
-        state_arg: 현재 상태
-        match_set_info_arg: 조립할 AssemblyType 정보 리스트
-        
-    Returns:
-        조립이 실행된 새로운 상태
+    Attributes:
+        layout (StateLayout): 조립부 테이블을 가진 부품 구조
+        assembly_data_base (AssemblyGroupDataBase): 컴파일에 사용한 조립 규칙 데이터베이스
+        revision (int): 컴파일 시점의 데이터베이스 revision
+        group_required_sub_type_list (list[tuple[int, ...] | None]): 
+            main_type id -> 필요한 sub_type id 구성 (조립 규칙이 없으면 None).
+            부품 구조에 없는 sub_type은 -1로 표시되어 항상 조립 불가로 판정됩니다.
+        group_arity_list (list[int]): main_type id -> 조립 한 번에 사용되는 조립부 개수 (규칙이 없으면 0)
+        port_item_array (np.ndarray | None): 비트 위치 -> 부품 인덱스 (numpy 백엔드용, 필요할 때 생성)
+        port_sub_type_array (np.ndarray | None): 비트 위치 -> sub_type id (numpy 백엔드용)
+        group_port_array_list (list[np.ndarray] | None): main_type id -> 해당 그룹 조립부 비트 위치 배열 (numpy 백엔드용)
     """
-    state_copy: State = copy.deepcopy(state_arg)
     
-    for item_uuid, assembly_type_index in match_set_info_arg:
-        for item in state_copy.get_item_state_list():
-            if item.get_uuid() == item_uuid:
-                assembly_type = item.get_type_by_index(assembly_type_index)
-                assembly_type.set_assembled_flag(True)
-                break
-    
-    state_copy.loging_action_sequence(match_set_info=match_set_info_arg)
-    return state_copy
+    def __init__(self, layout: StateLayout, assembly_data_base: AssemblyGroupDataBase) -> None:
+        """CompiledProblem 초기화
+        
+        Args:
+            layout: 부품 구조
+            assembly_data_base: 조립 규칙 데이터베이스
+        """
+        self.layout: StateLayout = layout
+        self.assembly_data_base: AssemblyGroupDataBase = assembly_data_base
+        self.revision: int = assembly_data_base.revision
+        self.group_required_sub_type_list: list[tuple[int, ...] | None] = []
+        self.group_arity_list: list[int] = []
+        self.port_item_array = None
+        self.port_sub_type_array = None
+        self.group_port_array_list = None
+        
+        for main_type in layout.main_type_name_list:
+            required_sub_type_list: list[str] | None = assembly_data_base.get_assembly_group_data(main_type)
+            if required_sub_type_list is None:
+                self.group_required_sub_type_list.append(None)
+                self.group_arity_list.append(0)
+                continue
+            self.group_required_sub_type_list.append(tuple(layout.sub_type_id_dict.get(sub_type, -1)
+                                                           for sub_type in required_sub_type_list))
+            self.group_arity_list.append(len(required_sub_type_list))
 
+    def create_init_state(self) -> 'State':
+        """컴파일된 부품 구조를 공유하는 초기 상태를 생성합니다"""
+        if self.layout.snapshot_init_mask is not None:
+            # 스냅샷은 부품 객체를 만들지 않고 저장된 초기 비트마스크로 상태를 생성
+            template_state: State = State.__new__(State)
+            template_state.layout = self.layout
+            template_state.item_state_list = self.layout.item_list
+            return template_state.create_state_from_mask(self.layout.snapshot_init_mask)
+        return State(self.layout.item_list, layout_arg=self.layout)
 
-def search_algorithm_temp_demo(init_state_arg: State, goal_state_arg: State, 
-                    assembly_data_base: AssemblyGroupDataBase) -> list[State]:
-    """조립 계획 탐색 알고리즘 (임시 데모 버전)
-    
-    초기 상태에서 목표 상태까지 도달하기 위한 조립 순서를 계획합니다.
-    
-    [중요: 임시 구현 상태]
-    본 함수는 다른 알고리즘 모듈의 작동을 테스트하기 위한 
-    단순화된 임시 버전입니다.
+    def prepare_numpy_table(self) -> None:
+        """numpy 백엔드에서 사용할 조립부 배열을 생성합니다 (최초 1회)"""
+        if self.port_item_array is not None:
+            return
+        if np is None:
+            raise ImportError("candidate_backend='numpy'를 사용하려면 numpy가 설치되어 있어야 합니다")
+        layout: StateLayout = self.layout
+        self.port_item_array = np.array(layout.port_item_list, dtype=np.int64)
+        self.port_sub_type_array = np.array(layout.port_sub_type_list, dtype=np.int64)
+        port_main_type_array = np.array(layout.port_main_type_list, dtype=np.int64)
+        self.group_port_array_list = [np.flatnonzero(port_main_type_array == main_type_id)
+                                      for main_type_id in range(len(layout.main_type_name_list))]
+
+
+# 결정적 부품 UUID 생성에 사용하는 네임스페이스
+ITEM_UUID_NAMESPACE: UUID = uuid.uuid5(uuid.NAMESPACE_URL, "assembly_planning_system/item")
+
+
+def assign_deterministic_uuid(item_list: list[Item]) -> None:
+    """부품 순서와 이름으로부터 결정적인 UUID를 부여합니다
     
-    아직 구현되지 않은 필수 기능:
-    - 다양한 조립 순서 조합 탐색 (Search Algorithm)
-    - 목표 상태(goal_state) 고려
+    uuid.uuid4() 대신 uuid.uuid5(ITEM_UUID_NAMESPACE, "<부품 인덱스>:<부품 이름>")를 사용하므로,
+    같은 부품 리스트로 만든 문제는 실행할 때마다 같은 UUID와 같은 탐색 결과를 가집니다.
+    이미 State를 만든 부품에 적용하면 기존 State의 UUID 색인과 어긋나므로
+    State 생성 전에 호출해야 합니다.
     
-    현재는 먼저 발견된 조립 가능한 후보부터 순서대로 조립하는
-    단순한 방식으로만 동작합니다.
-    이는 정식 Planning 알고리즘이 아니며, 
-    향후 연구 개발을 통해 핵심 알고리즘이 구현되어야 합니다.
+    Args:
+        item_list: UUID를 부여할 Item 객체들의 리스트
+    """
+    for item_index, item in enumerate(item_list):
+        item.uuid = uuid.uuid5(ITEM_UUID_NAMESPACE, f"{item_index}:{item.name}")
+
+
+def compile_problem(item_list: list[Item], assembly_data_base: AssemblyGroupDataBase,
+                    deterministic_uuid: bool = False, candidate_backend: str = "python") -> CompiledProblem:
+    """부품과 조립 규칙 데이터베이스를 정수 id 테이블로 컴파일합니다
     
     Args:
-        init_state_arg: 초기 상태
-        goal_state_arg: 목표 상태 (현재 미사용)
+        item_list: Item 객체들의 리스트
         assembly_data_base: 조립 규칙 데이터베이스
+        deterministic_uuid: 컴파일 전에 assign_deterministic_uuid로 부품 UUID를 
+            결정적인 값으로 바꿀지 여부 (기본값: False)
+        candidate_backend: 이 문제로 만든 상태들이 기본으로 사용할 후보 탐색 백엔드
+            ("python" 또는 "numpy", 기본값: "python")
         
     Returns:
-        조립 순서를 나타내는 최종 상태 리스트
+        컴파일된 조립 문제 (create_init_state로 초기 상태 생성)
     """
-    explored_count: int = 0
-    exploration_limit: int = 10000000
-    state: State = init_state_arg
-    
-    while True:
-        print(f"=== [Planning Step {explored_count+1}] ===")
-        explored_count += 1
-        if explored_count >= exploration_limit:
-            break
-            
-        # 현재 상태에서 가능한 조립 후보 탐색
-        candidate_match_list: list[list[tuple[UUID, int]]] = check_candidate_match(state, assembly_data_base)
-        print("▶ 발견된 타입 매칭 후보:")
-        
-        if len(candidate_match_list) == 0:
-            print("후보 리스트가 비었음!")
-            print("더 이상 조립 가능한 타입 그룹이 없으므로 Planning 종료.")
-            break
-        
-        print_match_info_list(state, candidate_match_list)
-        
-        # 첫 번째 후보 선택 (데모 버전 단순 전략)
-        print("▶ 선택된 타입 매칭 후보:")
-        elected_assembly_action: list[tuple[UUID, int]] = candidate_match_list[0]
-        print_match_info(state, elected_assembly_action)
-        
-        # 조립 실행 및 상태 갱신
-        print("▶ 조립 실행 및 상태 갱신:")
-        state = execute_assemble(state, candidate_match_list[0])
-        print_state_action_sequence_log(state)
-        print("\n-----\n")
-
-    return [state]  # plan은 1가지가 아닐 수 있으므로 리스트 형태로 반환
+    if deterministic_uuid:
+        assign_deterministic_uuid(item_list)
+    layout: StateLayout = StateLayout(item_list)
+    layout.candidate_backend = candidate_backend
+    compiled_problem: CompiledProblem = layout.get_compiled_problem(assembly_data_base)
+    if candidate_backend == "numpy":
+        compiled_problem.prepare_numpy_table()
+    return compiled_problem
 
 
-def search_algorithm_BFS(init_state_arg: State, goal_state_arg: State, 
-                    assembly_data_base: AssemblyGroupDataBase) -> list[State]:
-    """BFS를 사용하여 가능한 모든 조립 경로를 탐색합니다
-    
-    초기 상태에서 시작하여 너비 우선 탐색(BFS)을 통해 
-    모든 가능한 조립 순서를 시뮬레이션합니다.
-    각 상태에서 발견되는 모든 조립 후보에 대해 새로운 상태를 생성하고,
-    더 이상 조립이 불가능한 모든 최종 상태를 수집합니다.
+def save_problem_json(item_list: list[Item], assembly_data_base: AssemblyGroupDataBase, file_path: str) -> None:
+    """부품과 조립 규칙을 사람이 편집할 수 있는 JSON 문제 파일로 저장합니다
     
-    각 최종 상태의 action_sequence_log에는 초기 상태부터 
-    해당 최종 상태에 도달하기까지의 전체 조립 경로가 기록됩니다.
+    파일 형식:
+        {
+          "assembly_groups": {"A": ["m", "f"], ...},
+          "items": [{"name": "door", "uuid": "...",
+                     "types": [{"main_type": "A", "sub_type": "m", "assembled": false}, ...]}, ...]
+        }
     
     Args:
-        init_state_arg: 초기 상태
-        goal_state_arg: 목표 상태 (현재 미사용)
+        item_list: Item 객체들의 리스트
         assembly_data_base: 조립 규칙 데이터베이스
-        
-    Returns:
-        더 이상 조립이 불가능한 모든 최종 상태들의 리스트.
-        이는 시스템에서 가능한 모든 조립 경로의 경우의 수를 나타냅니다.
+        file_path: 저장할 파일 경로
     """
-    final_state_list: list[State] = []
-    queue: deque[State] = deque([init_state_arg])
+    problem_data: dict = {
+        "assembly_groups": assembly_data_base.assembly_group_data,
+        "items": [{"name": item.name, "uuid": str(item.get_uuid()),
+                   "types": [{"main_type": assembly_type.main_type, "sub_type": assembly_type.sub_type,
+                              "assembled": assembly_type.assembled_flag}
+                             for assembly_type in item.get_type_list()]}
+                  for item in item_list]}
+    with open(file_path, "w", encoding="utf-8") as problem_file:
+        json.dump(problem_data, problem_file, ensure_ascii=False, indent=2)
+
+
+def load_problem_json(file_path: str) -> tuple[list[Item], AssemblyGroupDataBase]:
+    """JSON 문제 파일(save_problem_json 형식)에서 부품과 조립 규칙을 생성합니다
     
-    # 탐색 과정 로깅
-    explored_count: int = 0
-    exploration_limit: int = 10000000# 무한 반복 한계 설정
+    부품의 "uuid"와 조립부의 "assembled"는 생략할 수 있습니다.
+    uuid가 없는 부품에는 assign_deterministic_uuid와 같은 결정적 UUID가 부여됩니다.
     
-    while queue:
-        current_state: State = queue.popleft()
-        explored_count += 1
-        # 무한 반복 방지
-        if explored_count >= exploration_limit:
-            break
-        
-        # 현재 상태에서 가능한 조립 후보 탐색
-        candidate_match_list: list[list[tuple[UUID, int]]] = check_candidate_match(current_state, assembly_data_base)
+    Args:
+        file_path: JSON 문제 파일 경로
         
-        if len(candidate_match_list) == 0:
-            # 더 이상 조립할 수 없는 최종 상태 도달
-            final_state_list.append(current_state)
-            print(f"최종 상태 발견 (탐색 횟수: {explored_count}, "
-                  f"조립 단계 수: {len(current_state.get_action_sequence_log())})")
-        else:
-            # 각 조립 후보에 대해 새로운 상태 생성 및 큐에 추가
-            for match_info in candidate_match_list:
-                new_state: State = execute_assemble(current_state, match_info)
-                queue.append(new_state)
+    Returns:
+        (부품 리스트, 조립 규칙 데이터베이스)
+    """
+    with open(file_path, encoding="utf-8") as problem_file:
+        problem_data: dict = json.load(problem_file)
     
-    print(f"\n완료: 총 {explored_count}개 상태 탐색, {len(final_state_list)}개 최종 상태 발견")
+    assembly_data_base = AssemblyGroupDataBase()
+    for main_type, sub_type_list in problem_data["assembly_groups"].items():
+        assembly_data_base.add_assembly_type_group([AssemblyType(main_type, sub_type) for sub_type in sub_type_list])
     
-    return final_state_list
+    item_list: list[Item] = []
+    for item_index, item_data in enumerate(problem_data["items"]):
+        item_name: str = item_data.get("name", "")
+        item_uuid: UUID = (UUID(item_data["uuid"]) if "uuid" in item_data
+                           else uuid.uuid5(ITEM_UUID_NAMESPACE, f"{item_index}:{item_name}"))
+        item = Item(item_name, item_uuid)
+        for type_data in item_data.get("types", []):
+            assembly_type = AssemblyType(type_data["main_type"], type_data.get("sub_type", ""))
+            assembly_type.set_assembled_flag(type_data.get("assembled", False))
+            item.add_type(assembly_type)
+        item_list.append(item)
+    
+    return item_list, assembly_data_base
 
 
-def print_state_action_sequence_log(state: State) -> None:
-    """조립 계획 시퀀스를 출력합니다
+# 문제 스냅샷 파일 식별자 (형식 변경 시 버전 바이트 증가)
+PROBLEM_SNAPSHOT_MAGIC: bytes = b"APSSNAP\x01"
+
+
+def save_problem_snapshot(compiled_problem: CompiledProblem, file_path: str) -> None:
+    """컴파일된 문제의 정수 테이블을 메모리 맵으로 불러올 수 있는 바이너리 스냅샷으로 저장합니다
     
-    각 조립 단계별로 어떤 부품들이 어떤 타입으로 조립되는지 출력합니다.
+    파일은 식별자, 헤더 길이(uint32), JSON 헤더(이름 목록, 조립 규칙, 구역 위치)와
+    8바이트 정렬된 구역들로 이루어집니다. 조립부별 테이블, 부품별 첫 조립부 위치,
+    port_index, 부품 UUID/이름, 초기 비트마스크가 각각 하나의 구역에 평탄하게 저장되므로
+    load_problem_snapshot은 파일을 메모리 맵으로 연 뒤 구역을 그대로 참조합니다.
+    정수 테이블은 현재 플랫폼의 바이트 순서로 저장됩니다.
     
     Args:
-        state: 출력할 상태 객체
+        compiled_problem: 저장할 컴파일된 문제 (부품 구조와 조립 규칙 포함)
+        file_path: 저장할 파일 경로
     """
-    action_sequence_log: list[list[tuple[UUID, int]]] = state.get_action_sequence_log()
-    item_list: list[Item] = state.get_item_state_list()
+    layout: StateLayout = compiled_problem.layout
+    item_count: int = len(layout.item_list)
     
-    if len(action_sequence_log) == 0:
-        print("[조립 단계 0]")
-        print("아직까지 수행된 조립 없음")
-    else:
-        for planning_step, match in enumerate(action_sequence_log):
-            print(f"[조립 단계 {planning_step + 1}]")
-            for item_uuid, assembly_type_index in match:
-                for item in item_list:
-                    if item.get_uuid() == item_uuid:
-                        print("부품 이름:", item.name)
-                        assembly_type = item.get_type_by_index(assembly_type_index)
-                        main_type, sub_type = assembly_type.get_type()
-                        print(f"  └─> 매칭 타입: {main_type}-{sub_type}")
-                        break
-            print("-----")
+    # port_index를 (main_type id, sub_type id) 순으로 평탄화
+    port_index_port_array = array.array("i")
+    port_index_table_array = array.array("i")
+    for main_type_id, sub_type_dict in enumerate(layout.port_index):
+        for sub_type_id, port_list in sub_type_dict.items():
+            port_index_table_array.extend((main_type_id, sub_type_id, len(port_index_port_array),
+                                           len(port_index_port_array) + len(port_list)))
+            port_index_port_array.extend(port_list)
+    
+    item_name_blob: bytes = b""
+    item_name_offset_array = array.array("i", [0])
+    for item in layout.item_list:
+        item_name_blob += item.name.encode("utf-8")
+        item_name_offset_array.append(len(item_name_blob))
+    
+    init_mask: int = compiled_problem.create_init_state().get_assembled_mask()
+    section_list: list[tuple[str, bytes]] = [
+        ("port_item", array.array("i", layout.port_item_list).tobytes()),
+        ("port_type_index", array.array("i", layout.port_type_index_list).tobytes()),
+        ("port_main_type", array.array("i", layout.port_main_type_list).tobytes()),
+        ("port_sub_type", array.array("i", layout.port_sub_type_list).tobytes()),
+        ("port_offset", array.array("i", layout.port_offset_list).tobytes()),
+        ("port_index_port", port_index_port_array.tobytes()),
+        ("port_index_table", port_index_table_array.tobytes()),
+        ("item_uuid", b"".join(item.get_uuid().bytes for item in layout.item_list)),
+        ("item_name_offset", item_name_offset_array.tobytes()),
+        ("item_name", item_name_blob),
+        ("init_mask", init_mask.to_bytes((layout.port_count + 7) // 8, "little")),
+    ]
+    
+    header: dict = {"byteorder": sys.byteorder, "item_count": item_count, "port_count": layout.port_count,
+                    "main_type_name_list": layout.main_type_name_list,
+                    "sub_type_name_list": layout.sub_type_name_list,
+                    "assembly_groups": compiled_problem.assembly_data_base.assembly_group_data,
+                    "section_dict": {}}
+    # 구역 위치는 헤더 길이에 따라 달라지므로, 위치 값이 바뀌지 않을 때까지 헤더를 다시 계산
+    header_bytes: bytes = b""
+    while True:
+        offset: int = len(PROBLEM_SNAPSHOT_MAGIC) + 4 + len(header_bytes)
+        section_dict: dict[str, list[int]] = {}
+        for section_name, section_bytes in section_list:
+            offset += -offset % 8
+            section_dict[section_name] = [offset, len(section_bytes)]
+            offset += len(section_bytes)
+        if section_dict == header["section_dict"]:
+            break
+        header["section_dict"] = section_dict
+        header_bytes = json.dumps(header, ensure_ascii=False).encode("utf-8")
+    
+    with open(file_path, "wb") as snapshot_file:
+        snapshot_file.write(PROBLEM_SNAPSHOT_MAGIC)
+        snapshot_file.write(struct.pack("<I", len(header_bytes)))
+        snapshot_file.write(header_bytes)
+        for section_name, section_bytes in section_list:
+            snapshot_file.write(b"\0" * (section_dict[section_name][0] - snapshot_file.tell()))
+            snapshot_file.write(section_bytes)
 
 
-def print_match_info_list(state: State, match_info_list: list[list[tuple[UUID, int]]]) -> None:
-    """매칭 정보 리스트를 출력합니다
+class _SnapshotItemList(Sequence):
+    """스냅샷의 부품을 처음 접근할 때 Item 객체로 만드는 읽기 전용 부품 리스트"""
     
-    Args:
-        state: 현재 상태
-        match_info_list: 출력할 매칭 정보 리스트
-    """
-    for match_index, match_set in enumerate(match_info_list):
-        print("--매칭[{}]--".format(match_index))
-        for item_uuid, index in match_set:
-            for item in state.get_item_state_list():
-                if item.get_uuid() == item_uuid:
-                    candidate_item = item
-                    break
-            assembly_type = candidate_item.get_type_by_index(index)
-            print("item: {:15}, assembly_main_type: {}, assembly_sub_type: {}".format(
-                candidate_item.name, assembly_type.main_type, assembly_type.sub_type))
+    def __init__(self, layout: StateLayout, item_uuid_view: memoryview, item_name_offset_view: memoryview,
+                 item_name_view: memoryview, init_mask: int) -> None:
+        self.layout: StateLayout = layout
+        self.item_uuid_view: memoryview = item_uuid_view
+        self.item_name_offset_view: memoryview = item_name_offset_view
+        self.item_name_view: memoryview = item_name_view
+        self.init_mask: int = init_mask
+        self.item_cache_list: list[Item | None] = [None] * (len(item_name_offset_view) - 1)
 
+    def __len__(self) -> int:
+        return len(self.item_cache_list)
 
-def print_match_info(state: State, match_info: list[tuple[UUID, int]]) -> None:
-    """매칭 정보를 출력합니다
+    def __getitem__(self, item_index: int) -> Item:
+        if isinstance(item_index, slice):
+            return [self[index] for index in range(*item_index.indices(len(self)))]
+        item: Item | None = self.item_cache_list[item_index]
+        if item is None:
+            item_index %= len(self)
+            layout: StateLayout = self.layout
+            item = Item(bytes(self.item_name_view[self.item_name_offset_view[item_index]:
+                                                  self.item_name_offset_view[item_index + 1]]).decode("utf-8"),
+                        UUID(bytes=bytes(self.item_uuid_view[item_index * 16:(item_index + 1) * 16])))
+            port_end: int = (layout.port_offset_list[item_index + 1] if item_index + 1 < len(self)
+                             else layout.port_count)
+            for port_bit in range(layout.port_offset_list[item_index], port_end):
+                assembly_type = AssemblyType(layout.main_type_name_list[layout.port_main_type_list[port_bit]],
+                                             layout.sub_type_name_list[layout.port_sub_type_list[port_bit]])
+                assembly_type.set_assembled_flag(bool(self.init_mask >> port_bit & 1))
+                item.add_type(assembly_type)
+            self.item_cache_list[item_index] = item
+        return item
+
+    def copy(self) -> list[Item]:
+        """모든 부품을 만든 일반 리스트를 반환합니다 (StateLayout 생성 시 사용)"""
+        return list(self)
+
+    def __reduce__(self) -> tuple:
+        # 프로세스 간 전달 시에는 메모리 맵 대신 일반 리스트로 변환
+        return list, (list(self),)
+
+
+class _SnapshotItemIndexDict(dict):
+    """스냅샷의 부품 UUID -> 부품 인덱스 색인 (처음 조회할 때 한 번에 생성)"""
+    
+    def __init__(self, item_uuid_view: memoryview) -> None:
+        super().__init__()
+        self.item_uuid_view: memoryview = item_uuid_view
+
+    def __missing__(self, item_uuid: UUID) -> int:
+        if len(self) == 0 and len(self.item_uuid_view) > 0:
+            uuid_bytes: bytes = bytes(self.item_uuid_view)
+            self.update((UUID(bytes=uuid_bytes[offset:offset + 16]), offset // 16)
+                        for offset in range(0, len(uuid_bytes), 16))
+            if item_uuid in self:
+                return self[item_uuid]
+        raise KeyError(item_uuid)
+
+
+def load_problem_snapshot(file_path: str, candidate_backend: str = "python") -> CompiledProblem:
+    """save_problem_snapshot으로 저장한 스냅샷을 메모리 맵으로 불러옵니다
+    
+    조립부 테이블과 port_index는 메모리 맵 위의 memoryview로 그대로 참조하므로
+    불러오는 비용은 부품/조립부 수와 무관합니다 (main_type, sub_type 수에만 비례).
+    부품(Item) 객체는 처음 접근할 때, UUID 색인은 처음 조회할 때 만들어지며,
+    초기 상태는 create_init_state가 저장된 비트마스크로 바로 생성합니다.
     
     Args:
-        state: 현재 상태
-        match_info: 출력할 매칭 정보
+        file_path: 스냅샷 파일 경로
+        candidate_backend: 이 문제로 만든 상태들이 기본으로 사용할 후보 탐색 백엔드
+        
+    Returns:
+        컴파일된 문제 (create_init_state로 초기 상태 생성)
     """
-    for item_uuid, index in match_info:
-        for item in state.get_item_state_list():
-            if item.get_uuid() == item_uuid:
-                candidate_item = item
-                break
-        assembly_type = candidate_item.get_type_by_index(index)
-        print("item: {:15}, assembly_main_type: {}, assembly_sub_type: {}".format(
-            candidate_item.name, assembly_type.main_type, assembly_type.sub_type))
+    with open(file_path, "rb") as snapshot_file:
+        snapshot_buffer = mmap.mmap(snapshot_file.fileno(), 0, access=mmap.ACCESS_READ)
+    snapshot_view = memoryview(snapshot_buffer)
+    if bytes(snapshot_view[:len(PROBLEM_SNAPSHOT_MAGIC)]) != PROBLEM_SNAPSHOT_MAGIC:
+        raise ValueError(f"문제 스냅샷 파일이 아닙니다: {file_path}")
+    header_offset: int = len(PROBLEM_SNAPSHOT_MAGIC) + 4
+    (header_length,) = struct.unpack_from("<I", snapshot_view, len(PROBLEM_SNAPSHOT_MAGIC))
+    header: dict = json.loads(bytes(snapshot_view[header_offset:header_offset + header_length]))
+    if header["byteorder"] != sys.byteorder:
+        raise ValueError(f"다른 바이트 순서({header['byteorder']})의 플랫폼에서 저장된 스냅샷입니다: {file_path}")
+    
+    def get_section(section_name: str, item_format: str | None = "i") -> memoryview:
+        offset, length = header["section_dict"][section_name]
+        section_view: memoryview = snapshot_view[offset:offset + length]
+        return section_view.cast(item_format) if item_format is not None else section_view
+    
+    layout: StateLayout = StateLayout.__new__(StateLayout)
+    layout.port_count = header["port_count"]
+    layout.port_offset_list = get_section("port_offset")
+    layout.main_type_name_list = header["main_type_name_list"]
+    layout.main_type_id_dict = {main_type: main_type_id for main_type_id, main_type
+                                in enumerate(layout.main_type_name_list)}
+    layout.sub_type_name_list = header["sub_type_name_list"]
+    layout.sub_type_id_dict = {sub_type: sub_type_id for sub_type_id, sub_type
+                               in enumerate(layout.sub_type_name_list)}
+    layout.port_item_list = get_section("port_item")
+    layout.port_type_index_list = get_section("port_type_index")
+    layout.port_main_type_list = get_section("port_main_type")
+    layout.port_sub_type_list = get_section("port_sub_type")
+    layout.port_index = [{} for _ in layout.main_type_name_list]
+    port_index_port_view: memoryview = get_section("port_index_port")
+    port_index_table_view: memoryview = get_section("port_index_table")
+    for table_offset in range(0, len(port_index_table_view), 4):
+        main_type_id, sub_type_id, start_index, end_index = port_index_table_view[table_offset:table_offset + 4]
+        layout.port_index[main_type_id][sub_type_id] = port_index_port_view[start_index:end_index]
+    layout.compiled_problem = None
+    layout.candidate_backend = candidate_backend
+    layout.snapshot_init_mask = int.from_bytes(get_section("init_mask", None), "little")
+    layout.symmetric_item_group_list = None
+    layout.item_index_dict = _SnapshotItemIndexDict(get_section("item_uuid", None))
+    layout.item_list = _SnapshotItemList(layout, get_section("item_uuid", None), get_section("item_name_offset"),
+                                         get_section("item_name", None), layout.snapshot_init_mask)
+    
+    assembly_data_base = AssemblyGroupDataBase()
+    for main_type, sub_type_list in header["assembly_groups"].items():
+        assembly_data_base.add_assembly_type_group([AssemblyType(main_type, sub_type) for sub_type in sub_type_list])
+    compiled_problem: CompiledProblem = layout.get_compiled_problem(assembly_data_base)
+    if candidate_backend == "numpy":
+        compiled_problem.prepare_numpy_table()
+    return compiled_problem
 
 
-def main() -> None:
-    """메인 함수: 조립 계획 시스템 데모"""
+class ActionLogNode:
+    """조립 과정 로그를 이루는 불변 연결 리스트의 노드
     
-    # ========================================
-    # 1. 데이터 생성 단계
-    # ========================================
+    각 노드는 직전 노드(이전까지의 로그)와 마지막 조립 액션만 가지므로,
+    자식 상태의 로그는 부모 상태의 로그 노드를 공유하고 노드 하나만 추가합니다.
+    전체 로그 리스트는 get_action_sequence_log로 요청할 때만 만들어집니다.
     
-    # --- 1-1. 조립 타입 데이터 생성 ---
-    type_A_m = AssemblyType(main_type_arg="A", sub_type_arg="m")
-    type_A_f = AssemblyType(main_type_arg="A", sub_type_arg="f")
-
-    type_B_m = AssemblyType(main_type_arg="B", sub_type_arg="m")
-    type_B_i = AssemblyType(main_type_arg="B", sub_type_arg="i")
-    type_B_f = AssemblyType(main_type_arg="B", sub_type_arg="f")
+    Attributes:
+        parent_node (ActionLogNode | None): 직전까지의 로그 노드 (첫 액션이면 None)
+        action (list[tuple[UUID, int]]): 마지막 조립 액션
+        depth (int): 로그의 길이 (조립 단계 수)
+    """
     
-    type_C_m = AssemblyType(main_type_arg="C", sub_type_arg="m")
-    type_C_f = AssemblyType(main_type_arg="C", sub_type_arg="f")
+    __slots__ = ("parent_node", "action", "depth")
+    
+    def __init__(self, parent_node: 'ActionLogNode | None', action: list[tuple[UUID, int]]) -> None:
+        """ActionLogNode 초기화
+        
+        Args:
+            parent_node: 직전까지의 로그 노드 (첫 액션이면 None)
+            action: 추가할 조립 액션
+        """
+        self.parent_node: ActionLogNode | None = parent_node
+        self.action: list[tuple[UUID, int]] = action
+        self.depth: int = 1 if parent_node is None else parent_node.depth + 1
 
-    type_D_m = AssemblyType(main_type_arg="D", sub_type_arg="m")
-    type_D_i = AssemblyType(main_type_arg="D", sub_type_arg="i")
-    type_D_f = AssemblyType(main_type_arg="D", sub_type_arg="f")
+    def get_action_sequence_log(self) -> list[list[tuple[UUID, int]]]:
+        """첫 액션부터 이 노드까지의 조립 액션 리스트를 만들어 반환합니다"""
+        action_sequence_log: list[list[tuple[UUID, int]]] = [[]] * self.depth
+        node: ActionLogNode | None = self
+        while node is not None:
+            action_sequence_log[node.depth - 1] = node.action
+            node = node.parent_node
+        return action_sequence_log
+
+
+class State:
+    """시스템의 전체 상태를 나타내는 클래스
+    
+    모든 부품(Item)의 현재 상태를 하나의 객체로 관리합니다.
+    Planning 시스템이 개별 아이템이 아닌 전체 상태를 기반으로 
+    의사결정을 할 수 있도록 합니다.
+    
+    부품 구조(StateLayout)는 부모와 자식 상태가 공유하고, 상태마다 달라지는
+    조립 여부는 조립부 비트마스크(assembled_mask) 하나로만 저장합니다.
+    따라서 자식 상태 생성 시 부품 객체를 복사할 필요가 없습니다.
+    
+    Attributes:
+        layout (StateLayout): 부모/자식 상태가 공유하는 불변 부품 구조
+        item_state_list (list[Item]): 현재 상태의 부품 리스트 (layout.item_list와 동일 객체)
+        assembled_mask (int): 조립에 사용된 조립부 비트마스크
+        free_port_index (list[dict[int, list[int]]] | None): 
+            조립에 사용되지 않은 조립부만 담은 port_index (필요할 때 생성)
+        group_candidate_match_list (list[list[tuple[tuple[int, ...], int, list[tuple[UUID, int]]]]] | None): 
+            main_type id별 (정렬 키, 조립부 비트마스크, 조립 정보) 후보 캐시 (check_candidate_match에서 생성)
+        candidate_compiled_problem (CompiledProblem | None): 후보 캐시를 만들 때 사용한 컴파일된 문제
+        action_log_node (ActionLogNode | None): 
+            조립 과정 로그의 마지막 노드 (부모 상태와 공유되는 연결 리스트, 조립 이력이 없으면 None)
+        parent_edge_list (list[tuple[State, list[tuple[UUID, int]]]]): 
+            이 상태로 들어오는 (부모 상태, 조립 액션) 간선 리스트
+    """
+    
+    def __init__(self, item_list: list[Item], layout_arg: StateLayout | None = None) -> None:
+        """State 초기화
+        
+        Args:
+            item_list: Item 객체들의 리스트
+            layout_arg: 공유할 부품 구조 (None이면 item_list로 새로 생성)
+        """
+        self.layout: StateLayout = StateLayout(item_list) if layout_arg is None else layout_arg
+        self.item_state_list: list[Item] = self.layout.item_list
+        self.assembled_mask: int = 0
+        self.free_port_index: list[dict[int, list[int]]] | None = None
+        self.group_candidate_match_list: list[list[tuple[tuple[int, ...], int, list[tuple[UUID, int]]]]] | None = None
+        self.candidate_compiled_problem: CompiledProblem | None = None
+        self.action_log_node: ActionLogNode | None = None
+        self.parent_edge_list: list[tuple['State', list[tuple[UUID, int]]]] = []
+        
+        # AssemblyType에 미리 설정된 조립 여부를 초기 비트마스크로 옮김
+        for item_index, item in enumerate(self.item_state_list):
+            port_offset: int = self.layout.port_offset_list[item_index]
+            for assembly_type_index, assembly_type in enumerate(item.get_type_list()):
+                if assembly_type.assembled_flag:
+                    self.assembled_mask |= 1 << (port_offset + assembly_type_index)
+
+    def create_state_from_mask(self, assembled_mask: int) -> 'State':
+        """부품 구조를 공유하고 조립 이력이 없는 상태를 비트마스크로부터 생성합니다
+        
+        프로세스 간 전달이나 파일 저장처럼 상태를 비트마스크로만 주고받은 뒤
+        다시 State로 복원할 때 사용합니다.
+        
+        Args:
+            assembled_mask: 생성할 상태의 조립부 비트마스크
+            
+        Returns:
+            새로운 상태 (조립 과정 로그, parent_edge_list는 비어 있음)
+        """
+        new_state: State = State.__new__(State)
+        new_state.layout = self.layout
+        new_state.item_state_list = self.item_state_list
+        new_state.assembled_mask = assembled_mask
+        new_state.free_port_index = None
+        new_state.group_candidate_match_list = None
+        new_state.candidate_compiled_problem = None
+        new_state.action_log_node = None
+        new_state.parent_edge_list = []
+        return new_state
+
+    def create_child_state(self, assembled_mask: int, match_set_info: list[tuple[UUID, int]]) -> 'State':
+        """부품 구조를 공유하는 자식 상태를 생성합니다
+        
+        자식 상태의 조립 과정 로그는 부모 상태의 로그 노드에 액션 하나를 이어 붙이므로
+        로그 복사 비용과 메모리는 깊이와 무관하게 일정합니다.
+        
+        Args:
+            assembled_mask: 자식 상태의 조립부 비트마스크
+            match_set_info: 이 상태에서 자식 상태로 가기 위해 수행한 조립 정보
+            
+        Returns:
+            새로운 자식 상태
+        """
+        child_state: State = self.create_state_from_mask(assembled_mask)
+        child_state.action_log_node = ActionLogNode(self.action_log_node, match_set_info)
+        child_state.parent_edge_list = [(self, match_set_info)]
+        return child_state
+
+    def get_item_state_list(self) -> list[Item]:
+        """부품 상태 리스트를 반환합니다"""
+        return self.item_state_list
+
+    def get_item_by_uuid(self, item_uuid: UUID) -> Item:
+        """부품 UUID에 해당하는 Item 객체를 반환합니다
+        
+        부품 구조(layout)의 UUID 색인을 사용하므로 부품 개수와 무관하게 O(1)입니다.
+        
+        Args:
+            item_uuid: 찾을 부품의 UUID
+        """
+        return self.layout.get_item_by_uuid(item_uuid)
+
+    def get_assembled_mask(self) -> int:
+        """조립에 사용된 조립부 비트마스크를 반환합니다"""
+        return self.assembled_mask
+
+    def get_assembled_flag(self, item_uuid: UUID, assembly_type_index: int) -> bool:
+        """현재 상태에서 해당 조립부가 조립에 사용되었는지 여부를 반환합니다
+        
+        Args:
+            item_uuid: 부품의 UUID
+            assembly_type_index: 조립부 타입 인덱스
+        """
+        return bool(self.assembled_mask >> self.layout.get_port_bit(item_uuid, assembly_type_index) & 1)
+
+    def get_free_port_index(self) -> list[dict[int, list[int]]]:
+        """조립에 사용되지 않은 조립부 색인을 반환합니다
+        
+        부모 상태의 색인이 이미 만들어져 있으면, 이번 조립으로 사용된 조립부의
+        main_type 항목만 다시 걸러내고 나머지 main_type 항목은 부모와 공유합니다.
+        
+        Returns:
+            main_type id -> sub_type id -> [비트 위치, ...]
+            (사용 가능한 조립부가 없는 sub_type은 포함되지 않음)
+        """
+        if self.free_port_index is not None:
+            return self.free_port_index
+        
+        parent_state: State | None = self.parent_edge_list[0][0] if self.parent_edge_list else None
+        if parent_state is not None and parent_state.free_port_index is not None:
+            free_port_index = parent_state.free_port_index.copy()
+            changed_mask: int = self.assembled_mask & ~parent_state.assembled_mask
+            for main_type_id in self.layout.get_mask_main_type_set(changed_mask):
+                free_port_index[main_type_id] = self._filter_free_port(free_port_index[main_type_id])
+        else:
+            free_port_index = [self._filter_free_port(sub_type_dict) for sub_type_dict in self.layout.port_index]
+        
+        self.free_port_index = free_port_index
+        return free_port_index
+
+    def _filter_free_port(self, sub_type_dict: dict[int, list[int]]) -> dict[int, list[int]]:
+        """sub_type별 조립부 리스트에서 조립에 사용되지 않은 조립부만 남깁니다"""
+        assembled_mask: int = self.assembled_mask
+        filtered_sub_type_dict: dict[int, list[int]] = {}
+        for sub_type_id, port_list in sub_type_dict.items():
+            free_port_list = [port_bit for port_bit in port_list if not assembled_mask >> port_bit & 1]
+            if free_port_list:
+                filtered_sub_type_dict[sub_type_id] = free_port_list
+        return filtered_sub_type_dict
+
+    def get_state_key(self) -> int:
+        """상태를 식별하는 정규화된 키를 반환합니다
+        
+        조립 순서와 무관하게 조립에 사용된 조립부 조합이 같으면
+        같은 키를 가지므로, 탐색 중 중복 상태를 판별하는 데 사용합니다.
+        
+        Returns:
+            조립부 비트마스크 (assembled_mask)
+        """
+        return self.assembled_mask
+
+    def get_canonical_state_key(self) -> int:
+        """대칭인 부품끼리의 자리 바꿈을 무시한 상태 키를 반환합니다
+        
+        같은 조립부 구성을 가진 부품(예: bolt1, bolt2)을 서로 바꾸기만 한 상태들은
+        같은 키를 가지므로, 대칭 감소(symmetry_reduction) 탐색의 중복 판별에 사용합니다.
+        
+        Returns:
+            대표 조립부 비트마스크 (StateLayout.get_canonical_mask 참고)
+        """
+        return self.layout.get_canonical_mask(self.assembled_mask)
+
+    def add_parent_edge(self, parent_state: 'State', match_set_info: list[tuple[UUID, int]]) -> None:
+        """이 상태로 들어오는 부모 간선을 추가합니다
+        
+        Args:
+            parent_state: 부모 상태
+            match_set_info: 부모 상태에서 이 상태로 오기 위해 수행한 조립 정보
+        """
+        self.parent_edge_list.append((parent_state, match_set_info))
+
+    def get_parent_edge_list(self) -> list[tuple['State', list[tuple[UUID, int]]]]:
+        """이 상태로 들어오는 (부모 상태, 조립 액션) 간선 리스트를 반환합니다"""
+        return self.parent_edge_list
+
+    def loging_action_sequence(self, match_set_info: list[tuple[UUID, int]]) -> None:
+        """조립 액션을 로그에 기록합니다
+        
+        Args:
+            match_set_info: 조립된 부품들의 (UUID, assembly_type_index) 정보
+        """
+        self.action_log_node = ActionLogNode(self.action_log_node, match_set_info)
+
+    def get_action_sequence_log(self) -> list[list[tuple[UUID, int]]]:
+        """조립 과정 로그를 반환합니다
+        
+        로그는 부모 상태와 공유되는 연결 리스트로 저장되므로, 호출할 때마다
+        첫 액션부터 마지막 액션까지의 새 리스트를 만들어 반환합니다 (O(조립 단계 수)).
+        """
+        if self.action_log_node is None:
+            return []
+        return self.action_log_node.get_action_sequence_log()
+
+    def get_depth(self) -> int:
+        """초기 상태로부터의 조립 단계 수를 반환합니다"""
+        return 0 if self.action_log_node is None else self.action_log_node.depth
+
+
+class SearchObserver:
+    """탐색 과정의 이벤트를 전달받는 관찰자(observer)의 기본 클래스
+    
+    탐색 함수에 observer 인자로 전달하면, 탐색 루프의 주요 지점에서 아래 메서드가 호출됩니다.
+    기본 구현은 아무 일도 하지 않으므로 필요한 메서드만 재정의하면 됩니다.
+    observer가 None이면 탐색 함수는 이벤트 호출과 시간 측정을 모두 생략하므로
+    관찰 기능을 사용하지 않을 때의 추가 비용은 없습니다.
+    """
+    
+    def on_state_expanded(self, state: State) -> None:
+        """상태 하나를 확장(조립 후보 탐색)하기 직전에 호출됩니다"""
+
+    def on_candidates_generated(self, state: State, candidate_match_list: list[list[tuple[UUID, int]]],
+                                elapsed_time: float) -> None:
+        """check_candidate_match가 끝난 후 호출됩니다
+        
+        Args:
+            state: 확장 중인 상태
+            candidate_match_list: 발견된 조립 후보 리스트
+            elapsed_time: 후보 탐색에 걸린 시간(초)
+        """
+
+    def on_state_created(self, parent_state: State, child_state: State, elapsed_time: float) -> None:
+        """조립 실행으로 자식 상태가 생성된 후 호출됩니다
+        
+        Args:
+            parent_state: 부모 상태
+            child_state: 생성된 자식 상태
+            elapsed_time: 상태 생성(복사)에 걸린 시간(초)
+        """
+
+    def on_duplicate_state(self, state: State, match_set_info: list[tuple[UUID, int]]) -> None:
+        """이미 발견된 상태에 다시 도달하여 확장을 생략할 때 호출됩니다
+        
+        Args:
+            state: 중복 상태에 도달한 부모 상태
+            match_set_info: 중복 상태로 가는 조립 정보
+        """
+
+    def on_final_state(self, state: State, explored_count: int) -> None:
+        """탐색 결과(최종 상태 또는 목표 상태)를 발견했을 때 호출됩니다
+        
+        Args:
+            state: 발견된 상태
+            explored_count: 지금까지 확장한 상태 수
+        """
+
+
+class SearchMetrics(SearchObserver):
+    """탐색 성능 지표를 집계하는 관찰자
+    
+    확장/생성/중복/최종 상태 수, 조립 후보 수, 후보 탐색과 상태 생성(복사)에 걸린 시간,
+    깊이별 분기 계수(확장한 상태당 조립 후보 수)를 모으고 JSON으로 내보낼 수 있습니다.
+    
+    Attributes:
+        expanded_state_count (int): 확장한 상태 수
+        generated_candidate_count (int): 발견된 조립 후보 수
+        created_state_count (int): 생성된 자식 상태 수
+        duplicate_state_count (int): 중복으로 확장을 생략한 횟수
+        final_state_count (int): 발견된 최종(목표) 상태 수
+        candidate_generation_time (float): 후보 탐색에 걸린 총 시간(초)
+        state_copy_time (float): 자식 상태 생성에 걸린 총 시간(초)
+        depth_expanded_count_dict (dict[int, int]): {깊이: 확장한 상태 수}
+        depth_candidate_count_dict (dict[int, int]): {깊이: 발견된 조립 후보 수}
+    """
+    
+    def __init__(self) -> None:
+        """SearchMetrics 초기화"""
+        self.expanded_state_count: int = 0
+        self.generated_candidate_count: int = 0
+        self.created_state_count: int = 0
+        self.duplicate_state_count: int = 0
+        self.final_state_count: int = 0
+        self.candidate_generation_time: float = 0.0
+        self.state_copy_time: float = 0.0
+        self.depth_expanded_count_dict: dict[int, int] = {}
+        self.depth_candidate_count_dict: dict[int, int] = {}
+
+    def on_state_expanded(self, state: State) -> None:
+        self.expanded_state_count += 1
+        depth: int = state.get_depth()
+        self.depth_expanded_count_dict[depth] = self.depth_expanded_count_dict.get(depth, 0) + 1
+
+    def on_candidates_generated(self, state: State, candidate_match_list: list[list[tuple[UUID, int]]],
+                                elapsed_time: float) -> None:
+        self.generated_candidate_count += len(candidate_match_list)
+        self.candidate_generation_time += elapsed_time
+        depth: int = state.get_depth()
+        self.depth_candidate_count_dict[depth] = (self.depth_candidate_count_dict.get(depth, 0)
+                                                  + len(candidate_match_list))
+
+    def on_state_created(self, parent_state: State, child_state: State, elapsed_time: float) -> None:
+        self.created_state_count += 1
+        self.state_copy_time += elapsed_time
+
+    def on_duplicate_state(self, state: State, match_set_info: list[tuple[UUID, int]]) -> None:
+        self.duplicate_state_count += 1
+
+    def on_final_state(self, state: State, explored_count: int) -> None:
+        self.final_state_count += 1
+
+    def get_branching_factor_dict(self) -> dict[int, float]:
+        """{깊이: 확장한 상태당 평균 조립 후보 수}를 반환합니다"""
+        return {depth: self.depth_candidate_count_dict.get(depth, 0) / expanded_count
+                for depth, expanded_count in sorted(self.depth_expanded_count_dict.items())}
+
+    def to_dict(self) -> dict[str, int | float | dict[int, float]]:
+        """집계된 지표를 딕셔너리로 반환합니다"""
+        return {"expanded_state_count": self.expanded_state_count,
+                "generated_candidate_count": self.generated_candidate_count,
+                "created_state_count": self.created_state_count,
+                "duplicate_state_count": self.duplicate_state_count,
+                "final_state_count": self.final_state_count,
+                "candidate_generation_time": self.candidate_generation_time,
+                "state_copy_time": self.state_copy_time,
+                "branching_factor_per_depth": self.get_branching_factor_dict()}
+
+    def dump_json(self, file_path: str | None = None) -> str:
+        """집계된 지표를 JSON 문자열로 변환하고, file_path가 주어지면 파일로도 저장합니다
+        
+        Args:
+            file_path: 저장할 파일 경로 (None이면 저장하지 않음)
+            
+        Returns:
+            JSON 문자열
+        """
+        json_text: str = json.dumps(self.to_dict(), indent=2)
+        if file_path is not None:
+            with open(file_path, "w", encoding="utf-8") as json_file:
+                json_file.write(json_text)
+        return json_text
+
+
+class PrintSearchObserver(SearchObserver):
+    """발견된 최종 상태를 출력하는 관찰자 (기존 탐색 로그 출력용)"""
+    
+    def on_final_state(self, state: State, explored_count: int) -> None:
+        print(f"최종 상태 발견 (탐색 횟수: {explored_count}, "
+              f"조립 단계 수: {state.get_depth()})")
+
+
+class SuccessorCache:
+    """상태 키별 조립 후보(successor) 리스트를 보관하는 크기 제한 LRU 캐시
+    
+    트리 탐색, DFS, IDDFS처럼 중복 상태를 병합하지 않는 탐색에서는 조립 순서만 다른 같은 상태가
+    여러 번 확장되므로, 상태 키(get_state_key: 조립 순서와 무관한 비트마스크)로 조립 후보 리스트를
+    기억해 두면 check_candidate_match를 다시 수행하지 않아도 됩니다.
+    대칭 감소의 대표 상태 키(get_canonical_state_key)는 조립 후보가 가리키는 부품이 달라지므로 사용하지 않습니다.
+    
+    하나의 캐시를 여러 탐색(BFS, DFS, 빔/A* 탐색)에 전달해 공유할 수 있으며,
+    조립 규칙이 변경(revision 증가)되거나 다른 부품 구조의 상태가 들어오면 내용을 비웁니다.
+    반환되는 후보 리스트는 캐시와 공유되므로 호출자가 수정해서는 안 됩니다.
+    
+    Attributes:
+        max_entry_count (int): 보관할 최대 상태 수
+        max_memory_bytes (int | None): 보관할 후보 리스트의 최대 추정 메모리(바이트, None이면 제한 없음)
+        entry_dict (OrderedDict[int, tuple[list[list[tuple[UUID, int]]], int]]): 
+            상태 키 -> (조립 후보 리스트, 추정 메모리) (오래 사용하지 않은 순)
+        memory_bytes (int): 보관 중인 후보 리스트의 추정 메모리(바이트)
+        compiled_problem (CompiledProblem | None): 보관 중인 후보 리스트를 계산한 컴파일된 문제
+        hit_count (int): 캐시 적중 횟수
+        miss_count (int): 캐시 실패(후보 새로 탐색) 횟수
+        eviction_count (int): 크기 제한으로 제거된 상태 수
+    """
+    
+    def __init__(self, max_entry_count: int = 100000, max_memory_bytes: int | None = None) -> None:
+        """SuccessorCache 초기화
+        
+        Args:
+            max_entry_count: 보관할 최대 상태 수 (기본값: 100000)
+            max_memory_bytes: 보관할 후보 리스트의 최대 추정 메모리(바이트, None이면 제한 없음)
+        """
+        self.max_entry_count: int = max_entry_count
+        self.max_memory_bytes: int | None = max_memory_bytes
+        self.entry_dict: OrderedDict[int, tuple[list[list[tuple[UUID, int]]], int]] = OrderedDict()
+        self.memory_bytes: int = 0
+        self.compiled_problem: CompiledProblem | None = None
+        self.hit_count: int = 0
+        self.miss_count: int = 0
+        self.eviction_count: int = 0
+
+    def get_candidate_match(self, state_arg: State, 
+                            assembly_data_base: AssemblyGroupDataBase) -> list[list[tuple[UUID, int]]]:
+        """캐시된 조립 후보 리스트를 반환합니다 (없으면 check_candidate_match로 탐색 후 저장)
+        
+        Args:
+            state_arg: 현재 상태
+            assembly_data_base: 조립 규칙 데이터베이스
+            
+        Returns:
+            check_candidate_match와 같은 조립 후보 리스트
+        """
+        compiled_problem: CompiledProblem = state_arg.layout.get_compiled_problem(assembly_data_base)
+        if compiled_problem is not self.compiled_problem:
+            self.clear()
+            self.compiled_problem = compiled_problem
+        
+        state_key: int = state_arg.get_state_key()
+        entry: tuple[list[list[tuple[UUID, int]]], int] | None = self.entry_dict.get(state_key)
+        if entry is not None:
+            self.hit_count += 1
+            self.entry_dict.move_to_end(state_key)
+            return entry[0]
+        
+        self.miss_count += 1
+        candidate_match_list: list[list[tuple[UUID, int]]] = check_candidate_match(state_arg, assembly_data_base)
+        entry_size: int = sys.getsizeof(candidate_match_list) + sum(
+            sys.getsizeof(match_info) + sum(sys.getsizeof(port_info) for port_info in match_info)
+            for match_info in candidate_match_list)
+        if self.max_memory_bytes is not None and entry_size > self.max_memory_bytes:
+            # 혼자서도 제한을 넘는 후보 리스트는 저장하지 않음
+            return candidate_match_list
+        self.entry_dict[state_key] = (candidate_match_list, entry_size)
+        self.memory_bytes += entry_size
+        while len(self.entry_dict) > self.max_entry_count or (
+                self.max_memory_bytes is not None and self.memory_bytes > self.max_memory_bytes):
+            _, (_, evicted_size) = self.entry_dict.popitem(last=False)
+            self.memory_bytes -= evicted_size
+            self.eviction_count += 1
+        return candidate_match_list
+
+    def clear(self) -> None:
+        """보관 중인 후보 리스트를 모두 제거합니다 (적중/실패 횟수는 유지)"""
+        self.entry_dict.clear()
+        self.memory_bytes = 0
+        self.compiled_problem = None
+
+    def get_hit_rate(self) -> float:
+        """캐시 적중률을 반환합니다 (조회한 적이 없으면 0.0)"""
+        lookup_count: int = self.hit_count + self.miss_count
+        return self.hit_count / lookup_count if lookup_count else 0.0
+
+    def to_dict(self) -> dict[str, int | float]:
+        """캐시 통계를 딕셔너리로 반환합니다"""
+        return {
+            "entry_count": len(self.entry_dict),
+            "memory_bytes": self.memory_bytes,
+            "hit_count": self.hit_count,
+            "miss_count": self.miss_count,
+            "eviction_count": self.eviction_count,
+            "hit_rate": self.get_hit_rate(),
+        }
+
+
+def check_candidate_match(state_arg: State, assembly_data_base: AssemblyGroupDataBase,
+                          backend: str | None = None) -> list[list[tuple[UUID, int]]]:
+    """현재 상태에서 가능한 조립 후보들을 탐색합니다
+    
+    주어진 상태(State)에서 조립 가능한 AssemblyType 조합들을 찾습니다.
+    각 조합은 데이터베이스의 조립 규칙을 만족해야 합니다.
+    조립 규칙은 부품 구조의 정수 id 테이블로 컴파일(CompiledProblem)된 후 사용됩니다.
+    
+    조립 후보는 main_type 그룹마다 필요한 sub_type별로 서로 다른 부품의 미사용 조립부를
+    하나씩 고르는 모든 조합입니다 (_find_group_candidate_match 참고).
+    
+    조립 후보는 main_type 그룹별로 상태에 캐시됩니다. 부모 상태의 캐시가 있으면
+    직전 조립으로 사용된 조립부의 main_type 그룹에서 그 조립부를 쓰는 후보만 제거하고,
+    나머지 그룹의 후보는 부모 상태의 것을 그대로 이어받습니다.
+    (조립부는 사용되기만 하고 다시 풀리지 않으므로, 자식 상태의 후보는
+    항상 부모 상태 후보의 부분집합입니다.)
+    
+    backend가 "numpy"이면 _check_candidate_match_numpy로 모든 그룹의 후보를
+    배열 연산으로 한 번에 계산합니다 (후보 캐시는 사용하지 않으며 결과는 같음).
+    
+    Args:
+        state_arg: 현재 시스템 상태
+        assembly_data_base: 조립 규칙 데이터베이스
+        backend: 후보 탐색 백엔드 ("python" 또는 "numpy", None이면 state_arg.layout.candidate_backend)
+        
+    Returns:
+        조립 가능한 AssemblyType 조합들의 리스트
+        각 조합은 [(UUID, int), (UUID, int), ...] 형태
+    """
+    compiled_problem: CompiledProblem = state_arg.layout.get_compiled_problem(assembly_data_base)
+    if backend is None:
+        backend = state_arg.layout.candidate_backend
+    if backend == "numpy":
+        return _check_candidate_match_numpy(state_arg, compiled_problem)
+    if backend != "python":
+        raise ValueError(f"지원하지 않는 후보 탐색 백엔드: {backend}")
+    
+    group_candidate_match_list = state_arg.group_candidate_match_list
+    
+    if group_candidate_match_list is None or state_arg.candidate_compiled_problem is not compiled_problem:
+        parent_state: State | None = state_arg.parent_edge_list[0][0] if state_arg.parent_edge_list else None
+        
+        if (parent_state is not None and parent_state.group_candidate_match_list is not None
+                and parent_state.candidate_compiled_problem is compiled_problem):
+            # 직전 조립으로 바뀐 main_type 그룹에서 사용된 조립부를 포함한 후보만 제거
+            group_candidate_match_list = parent_state.group_candidate_match_list.copy()
+            changed_mask: int = state_arg.get_assembled_mask() & ~parent_state.get_assembled_mask()
+            for main_type_id in state_arg.layout.get_mask_main_type_set(changed_mask):
+                group_candidate_match_list[main_type_id] = [
+                    candidate for candidate in group_candidate_match_list[main_type_id]
+                    if candidate[1] & changed_mask == 0]
+        else:
+            group_candidate_match_list = [
+                _find_group_candidate_match(state_arg, compiled_problem, main_type_id, free_sub_type_dict)
+                for main_type_id, free_sub_type_dict in enumerate(state_arg.get_free_port_index())]
+        
+        state_arg.group_candidate_match_list = group_candidate_match_list
+        state_arg.candidate_compiled_problem = compiled_problem
+
+    # 마지막 부품을 anchor로 하는 후보부터 나열
+    keyed_match_list: list[tuple[tuple[int, ...], int, list[tuple[UUID, int]]]] = [
+        candidate
+        for group_keyed_match_list in group_candidate_match_list
+        for candidate in group_keyed_match_list]
+    keyed_match_list.sort(key=lambda candidate: candidate[0])
+    candidate_match_list: list[list[tuple[UUID, int]]] = [match for _, _, match in keyed_match_list]
+
+    return candidate_match_list
+
+
+def _find_group_candidate_match(state_arg: State, compiled_problem: CompiledProblem, main_type_id: int, 
+                                free_sub_type_dict: dict[int, list[int]]
+                                ) -> list[tuple[tuple[int, ...], int, list[tuple[UUID, int]]]]:
+    """하나의 main_type 그룹에서 조립 가능한 모든 후보를 백트래킹으로 탐색합니다
+    
+    조립 그룹의 조립부들은 모두 서로 다른 부품에 있어야 하므로, 그중 부품 인덱스가
+    가장 큰 조립부(anchor)는 유일합니다. anchor마다 나머지 sub_type 자리를
+    anchor보다 앞선 부품의 미사용 조립부로 채우는 모든 조합을 백트래킹으로 나열하므로,
+    같은 조립 그룹은 정확히 한 번만 생성됩니다. 같은 sub_type이 여러 번 필요한 그룹은
+    그 자리들에 비트 위치가 증가하는 순서로만 조립부를 배정하여 순열 중복을 막습니다.
+    
+    남은 자리 중 공급 가능한(anchor보다 앞서고 아직 선택되지 않은 부품의) 조립부가
+    없는 sub_type이 생기면 그 즉시 해당 가지를 잘라냅니다.
+    
+    Args:
+        state_arg: 현재 시스템 상태
+        compiled_problem: 컴파일된 조립 문제
+        main_type_id: 탐색할 main_type id
+        free_sub_type_dict: 해당 main_type의 미사용 조립부 색인 (sub_type id -> 비트 위치 리스트)
+        
+    Returns:
+        ((-anchor 부품 인덱스, anchor 비트 위치, 나머지 비트 위치...) 정렬 키, 조립부 비트마스크, 조립 정보) 리스트
+    """
+    layout: StateLayout = state_arg.layout
+    port_item_list: list[int] = layout.port_item_list
+    keyed_match_list: list[tuple[tuple[int, ...], int, list[tuple[UUID, int]]]] = []
+
+    required_sub_type_list: tuple[int, ...] | None = compiled_problem.group_required_sub_type_list[main_type_id]
+    if required_sub_type_list is None:
+        return keyed_match_list
+    if any(sub_type_id not in free_sub_type_dict for sub_type_id in required_sub_type_list):
+        # 필요한 sub_type 중 남은 조립부가 없는 것이 있으면 이 그룹은 조립 불가
+        return keyed_match_list
+    
+    for anchor_sub_type_id in set(required_sub_type_list):
+        remaining_sub_type_list: list[int] = sorted(required_sub_type_list)
+        remaining_sub_type_list.remove(anchor_sub_type_id)
+        
+        for anchor_port in free_sub_type_dict[anchor_sub_type_id]:
+            anchor_item_index: int = port_item_list[anchor_port]
+            # 자리별 공급 후보: anchor보다 앞선 부품의 미사용 조립부 (비트 위치 순 = 부품 인덱스 순)
+            slot_port_list_list: list[list[int]] = []
+            for sub_type_id in remaining_sub_type_list:
+                port_list: list[int] = free_sub_type_dict[sub_type_id]
+                slot_port_list_list.append(
+                    port_list[:bisect.bisect_left(port_list, anchor_item_index, key=port_item_list.__getitem__)])
+            if any(len(slot_port_list) < remaining_sub_type_list.count(sub_type_id)
+                   for sub_type_id, slot_port_list in zip(remaining_sub_type_list, slot_port_list_list)):
+                # 공급 가능한 조립부가 필요한 개수보다 적은 sub_type이 있음
+                continue
+            
+            for partner_port_list in _iterate_group_partner(slot_port_list_list, remaining_sub_type_list,
+                                                            port_item_list, [], {anchor_item_index}):
+                partner_port_list = sorted(partner_port_list)
+                member_list: list[int] = [anchor_port, *partner_port_list]
+                match_mask: int = 0
+                for port_bit in member_list:
+                    match_mask |= 1 << port_bit
+                candidate_assembly_info_list: list[tuple[UUID, int]] = [layout.get_port_info(port_bit)
+                                                                        for port_bit in member_list]
+                keyed_match_list.append(((-anchor_item_index, anchor_port, *partner_port_list),
+                                         match_mask, candidate_assembly_info_list))
+
+    return keyed_match_list
+
+
+def _iterate_group_partner(slot_port_list_list: list[list[int]], slot_sub_type_list: list[int],
+                           port_item_list: list[int], chosen_port_list: list[int],
+                           used_item_index_set: set[int]) -> Iterator[list[int]]:
+    """조립 그룹의 나머지 자리들을 채우는 조립부 조합을 백트래킹으로 생성합니다
+    
+    Args:
+        slot_port_list_list: 자리별 공급 후보 조립부 비트 위치 리스트
+        slot_sub_type_list: 자리별 sub_type id (같은 sub_type은 연속으로 정렬되어 있어야 함)
+        port_item_list: 비트 위치별 부품 인덱스
+        chosen_port_list: 앞 자리들에 이미 선택된 조립부 (재귀 중 공유되며 호출 후 원래대로 복구됨)
+        used_item_index_set: 이미 선택된 부품 인덱스 집합 (재귀 중 공유되며 호출 후 원래대로 복구됨)
+        
+    Yields:
+        자리 순서대로 선택된 조립부 비트 위치 리스트
+    """
+    slot_index: int = len(chosen_port_list)
+    if slot_index == len(slot_port_list_list):
+        yield chosen_port_list.copy()
+        return
+    
+    slot_port_list: list[int] = slot_port_list_list[slot_index]
+    start_index: int = 0
+    if slot_index > 0 and slot_sub_type_list[slot_index - 1] == slot_sub_type_list[slot_index]:
+        # 같은 sub_type 자리는 비트 위치가 증가하는 순서로만 배정 (순열 중복 방지)
+        start_index = bisect.bisect_right(slot_port_list, chosen_port_list[-1])
+    
+    for port_bit in slot_port_list[start_index:]:
+        item_index: int = port_item_list[port_bit]
+        if item_index in used_item_index_set:
+            continue
+        chosen_port_list.append(port_bit)
+        used_item_index_set.add(item_index)
+        # 남은 자리 중 공급 가능한 조립부가 없는 자리가 있으면 더 내려가지 않음
+        if all(any(port_item_list[next_port] not in used_item_index_set for next_port in next_slot_port_list)
+               for next_slot_port_list in slot_port_list_list[slot_index + 1:]):
+            yield from _iterate_group_partner(slot_port_list_list, slot_sub_type_list, port_item_list,
+                                              chosen_port_list, used_item_index_set)
+        chosen_port_list.pop()
+        used_item_index_set.remove(item_index)
+
+
+def _check_candidate_match_numpy(state_arg: State, compiled_problem: CompiledProblem) -> list[list[tuple[UUID, int]]]:
+    """numpy 배열 연산으로 모든 main_type 그룹의 조립 후보를 탐색합니다
+    
+    _find_group_candidate_match와 같은 후보(서로 다른 부품의 미사용 조립부를
+    sub_type 자리마다 하나씩 고르는 모든 조합)를 백트래킹 대신
+    자리별 조립부 배열의 데카르트 곱과 불리언 마스킹으로 한 번에 계산합니다.
+    데카르트 곱 크기(자리별 미사용 조립부 수의 곱)만큼 메모리를 사용하므로
+    그룹당 조립부가 많은 문제에서는 python 백엔드가 더 적합합니다.
+    
+    Args:
+        state_arg: 현재 시스템 상태
+        compiled_problem: 컴파일된 조립 문제
+        
+    Returns:
+        check_candidate_match와 같은 형태, 같은 순서의 조립 후보 리스트
+    """
+    compiled_problem.prepare_numpy_table()
+    layout: StateLayout = state_arg.layout
+    port_item_array = compiled_problem.port_item_array
+    port_sub_type_array = compiled_problem.port_sub_type_array
+    
+    # 정수 비트마스크를 조립부별 불리언 배열로 변환
+    byte_count: int = (layout.port_count + 7) // 8
+    assembled_array = np.unpackbits(
+        np.frombuffer(state_arg.get_assembled_mask().to_bytes(byte_count, "little"), dtype=np.uint8),
+        bitorder="little")[:layout.port_count].astype(bool)
+    
+    keyed_match_list: list[tuple[tuple[int, ...], list[tuple[UUID, int]]]] = []
+    for main_type_id, required_sub_type_list in enumerate(compiled_problem.group_required_sub_type_list):
+        if required_sub_type_list is None:
+            continue
+        group_port_array = compiled_problem.group_port_array_list[main_type_id]
+        free_port_array = group_port_array[~assembled_array[group_port_array]]
+        free_sub_type_array = port_sub_type_array[free_port_array]
+        slot_sub_type_list: list[int] = sorted(required_sub_type_list)
+        slot_port_array_list = [free_port_array[free_sub_type_array == sub_type_id]
+                                for sub_type_id in slot_sub_type_list]
+        if any(len(port_array) == 0 for port_array in slot_port_array_list):
+            # 필요한 sub_type 중 남은 조립부가 없는 것이 있으면 이 그룹은 조립 불가
+            continue
+        
+        # (조합 수 x 자리 수) 조립부 행렬
+        member_port_matrix = np.stack([port_grid.ravel() for port_grid
+                                       in np.meshgrid(*slot_port_array_list, indexing="ij")], axis=1)
+        member_item_matrix = port_item_array[member_port_matrix]
+        valid_array = np.ones(len(member_port_matrix), dtype=bool)
+        for slot_index in range(1, len(slot_sub_type_list)):
+            if slot_sub_type_list[slot_index - 1] == slot_sub_type_list[slot_index]:
+                # 같은 sub_type 자리는 비트 위치가 증가하는 순서로만 배정 (순열 중복 방지)
+                valid_array &= member_port_matrix[:, slot_index - 1] < member_port_matrix[:, slot_index]
+            # 모든 조립부는 서로 다른 부품에 있어야 함
+            valid_array &= (member_item_matrix[:, slot_index, None] != member_item_matrix[:, :slot_index]).all(axis=1)
+        member_port_matrix = member_port_matrix[valid_array]
+        member_item_matrix = member_item_matrix[valid_array]
+        
+        # 부품 인덱스가 가장 큰 조립부를 anchor로, 나머지는 비트 위치 순으로 정렬
+        anchor_index_array = member_item_matrix.argmax(axis=1)
+        row_index_array = np.arange(len(member_port_matrix))
+        anchor_port_array = member_port_matrix[row_index_array, anchor_index_array]
+        anchor_item_array = member_item_matrix[row_index_array, anchor_index_array]
+        member_port_matrix[row_index_array, anchor_index_array] = -1
+        partner_port_matrix = np.sort(member_port_matrix, axis=1)[:, 1:]
+        
+        for anchor_port, anchor_item_index, partner_port_row in zip(anchor_port_array.tolist(),
+                                                                    anchor_item_array.tolist(),
+                                                                    partner_port_matrix.tolist()):
+            candidate_assembly_info_list: list[tuple[UUID, int]] = [layout.get_port_info(port_bit)
+                                                                    for port_bit in (anchor_port, *partner_port_row)]
+            keyed_match_list.append(((-anchor_item_index, anchor_port, *partner_port_row), candidate_assembly_info_list))
+    
+    # 마지막 부품을 anchor로 하는 후보부터 나열
+    keyed_match_list.sort(key=lambda keyed_match: keyed_match[0])
+    return [match for _, match in keyed_match_list]
+
+
+def execute_assemble(state_arg: State, match_set_info_arg: list[tuple[UUID, int]]) -> State:
+    """조립을 실행합니다
+    
+    조립할 조립부들의 비트를 켠 비트마스크로 자식 상태를 생성하여
+    해당 타입들이 조립에 사용되었음을 표시합니다.
+    부품 구조는 부모 상태와 공유하므로 복사 비용은 조립부 개수와 무관합니다.
+    
+    Args:
+        state_arg: 현재 상태
+        match_set_info_arg: 조립할 AssemblyType 정보 리스트
+        
+    Returns:
+        조립이 실행된 새로운 상태
+    """
+    match_mask: int = state_arg.layout.get_match_mask(match_set_info_arg)
+    return state_arg.create_child_state(state_arg.get_assembled_mask() | match_mask, match_set_info_arg)
+
+
+def iterate_successor(state_arg: State, assembly_data_base: AssemblyGroupDataBase,
+                      candidate_match_list: list[list[tuple[UUID, int]]] | None = None,
+                      observer: SearchObserver | None = None
+                      ) -> Iterator[tuple[list[tuple[UUID, int]], State]]:
+    """현재 상태의 자식 상태들을 하나씩 생성합니다 (탐색 알고리즘 공용 successor 함수)
+    
+    자식 상태는 요청될 때마다 하나씩 만들어지므로, 깊이 우선 탐색처럼
+    형제 상태를 한꺼번에 보관할 필요가 없는 탐색에서 메모리를 아낄 수 있습니다.
+    
+    Args:
+        state_arg: 현재 상태
+        assembly_data_base: 조립 규칙 데이터베이스
+        candidate_match_list: 이미 계산한 조립 후보 리스트 (None이면 새로 탐색)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        
+    Yields:
+        (조립 정보, 조립 후 자식 상태) 튜플
+    """
+    if candidate_match_list is None:
+        candidate_match_list = observe_candidate_match(state_arg, assembly_data_base, observer)
+    for match_info in candidate_match_list:
+        yield match_info, observe_execute_assemble(state_arg, match_info, observer)
+
+
+def observe_candidate_match(state_arg: State, assembly_data_base: AssemblyGroupDataBase,
+                            observer: SearchObserver | None,
+                            successor_cache: SuccessorCache | None = None) -> list[list[tuple[UUID, int]]]:
+    """check_candidate_match를 수행하고, observer가 있으면 걸린 시간과 함께 알립니다
+    
+    successor_cache가 주어지면 check_candidate_match 대신 캐시를 조회합니다.
+    """
+    find_candidate_match: Callable[[State, AssemblyGroupDataBase], list[list[tuple[UUID, int]]]] = (
+        check_candidate_match if successor_cache is None else successor_cache.get_candidate_match)
+    if observer is None:
+        return find_candidate_match(state_arg, assembly_data_base)
+    start_time: float = time.perf_counter()
+    candidate_match_list: list[list[tuple[UUID, int]]] = find_candidate_match(state_arg, assembly_data_base)
+    observer.on_candidates_generated(state_arg, candidate_match_list, time.perf_counter() - start_time)
+    return candidate_match_list
+
+
+def observe_execute_assemble(state_arg: State, match_set_info_arg: list[tuple[UUID, int]],
+                             observer: SearchObserver | None) -> State:
+    """execute_assemble을 수행하고, observer가 있으면 걸린 시간과 함께 알립니다"""
+    if observer is None:
+        return execute_assemble(state_arg, match_set_info_arg)
+    start_time: float = time.perf_counter()
+    new_state: State = execute_assemble(state_arg, match_set_info_arg)
+    observer.on_state_created(state_arg, new_state, time.perf_counter() - start_time)
+    return new_state
+
+
+def search_algorithm_temp_demo(init_state_arg: State, goal_state_arg: State, 
+                    assembly_data_base: AssemblyGroupDataBase,
+                    observer: SearchObserver | None = None) -> list[State]:
+    """조립 계획 탐색 알고리즘 (임시 데모 버전)
+    
+    초기 상태에서 목표 상태까지 도달하기 위한 조립 순서를 계획합니다.
+    
+    [중요: 임시 구현 상태]
+    본 함수는 다른 알고리즘 모듈의 작동을 테스트하기 위한 
+    단순화된 임시 버전입니다.
+    
+    아직 구현되지 않은 필수 기능:
+    - 다양한 조립 순서 조합 탐색 (Search Algorithm)
+    - 목표 상태(goal_state) 고려
+    
+    현재는 먼저 발견된 조립 가능한 후보부터 순서대로 조립하는
+    단순한 방식으로만 동작합니다.
+    이는 정식 Planning 알고리즘이 아니며, 
+    향후 연구 개발을 통해 핵심 알고리즘이 구현되어야 합니다.
+    
+    단계별 진행 과정을 출력하는 것이 목적인 데모이므로 출력은 그대로 유지하며,
+    observer로 탐색 지표를 함께 수집할 수 있습니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 상태 (현재 미사용)
+        assembly_data_base: 조립 규칙 데이터베이스
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        
+    Returns:
+        조립 순서를 나타내는 최종 상태 리스트
+    """
+    explored_count: int = 0
+    exploration_limit: int = 10000000
+    state: State = init_state_arg
+    
+    while True:
+        print(f"=== [Planning Step {explored_count+1}] ===")
+        explored_count += 1
+        if explored_count >= exploration_limit:
+            break
+            
+        # 현재 상태에서 가능한 조립 후보 탐색
+        if observer is not None:
+            observer.on_state_expanded(state)
+        candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(state, assembly_data_base, observer)
+        print("▶ 발견된 타입 매칭 후보:")
+        
+        if len(candidate_match_list) == 0:
+            if observer is not None:
+                observer.on_final_state(state, explored_count)
+            print("후보 리스트가 비었음!")
+            print("더 이상 조립 가능한 타입 그룹이 없으므로 Planning 종료.")
+            break
+        
+        print_match_info_list(state, candidate_match_list)
+        
+        # 첫 번째 후보 선택 (데모 버전 단순 전략)
+        print("▶ 선택된 타입 매칭 후보:")
+        elected_assembly_action: list[tuple[UUID, int]] = candidate_match_list[0]
+        print_match_info(state, elected_assembly_action)
+        
+        # 조립 실행 및 상태 갱신
+        print("▶ 조립 실행 및 상태 갱신:")
+        state = observe_execute_assemble(state, candidate_match_list[0], observer)
+        print_state_action_sequence_log(state)
+        print("\n-----\n")
+
+    return [state]  # plan은 1가지가 아닐 수 있으므로 리스트 형태로 반환
+
+
+def search_algorithm_BFS(init_state_arg: State, goal_state_arg: State, 
+                    assembly_data_base: AssemblyGroupDataBase,
+                    graph_search: bool = False, partial_order_reduction: bool = False,
+                    observer: SearchObserver | None = None, frontier_directory: str | None = None,
+                    checkpoint_path: str | None = None, checkpoint_interval: float = 300.0,
+                    resume: bool = False, symmetry_reduction: bool = False,
+                    state_graph: bool = False,
+                    successor_cache: SuccessorCache | None = None) -> 'list[State] | AssemblyStateGraph':
+    """BFS를 사용하여 가능한 모든 조립 경로를 탐색합니다
+    
+    iterate_search_BFS가 생성하는 최종 상태를 모두 모아 리스트로 반환합니다.
+    탐색 옵션은 iterate_search_BFS와 같습니다.
+    frontier_directory가 주어지면 탐색 큐와 방문 테이블을 디스크에 두는
+    iterate_search_BFS_on_disk를 사용합니다.
+    state_graph가 True이면 최종 상태 리스트 대신 build_state_graph로 만든
+    상태 공간 DAG(AssemblyStateGraph)를 반환합니다 (graph_search 값과 무관하게 모든 간선 포함).
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 상태 (현재 미사용)
+        assembly_data_base: 조립 규칙 데이터베이스
+        graph_search: 중복 상태 병합(그래프 탐색) 사용 여부 (기본값: False)
+        partial_order_reduction: sleep set 기반 부분 순서 감소 사용 여부 (기본값: False)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        frontier_directory: 탐색 큐를 저장할 디렉토리 (None이면 메모리에서 탐색)
+        checkpoint_path: 체크포인트 파일 경로 (iterate_search_BFS 참고)
+        checkpoint_interval: 체크포인트 저장 간격(초)
+        resume: checkpoint_path의 체크포인트에서 탐색을 이어서 수행할지 여부
+        symmetry_reduction: 대칭인 부품의 자리 바꿈만 다른 상태 병합 사용 여부 (기본값: False)
+        state_graph: 최종 상태 리스트 대신 상태 공간 DAG를 반환할지 여부 (기본값: False)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Returns:
+        더 이상 조립이 불가능한 모든 최종 상태들의 리스트.
+        이는 시스템에서 가능한 모든 조립 경로의 경우의 수를 나타냅니다.
+        state_graph가 True이면 AssemblyStateGraph
+    """
+    if state_graph:
+        if (partial_order_reduction or symmetry_reduction or frontier_directory is not None
+                or checkpoint_path is not None):
+            raise ValueError("상태 그래프 결과는 partial_order_reduction, symmetry_reduction, "
+                             "디스크 기반 BFS, 체크포인트를 지원하지 않습니다")
+        return build_state_graph(init_state_arg, assembly_data_base, observer=observer,
+                                 successor_cache=successor_cache)
+    if frontier_directory is not None:
+        if partial_order_reduction or symmetry_reduction or checkpoint_path is not None:
+            raise ValueError("디스크 기반 BFS는 partial_order_reduction, symmetry_reduction과 체크포인트를 지원하지 않습니다")
+        return list(iterate_search_BFS_on_disk(init_state_arg, goal_state_arg, assembly_data_base, frontier_directory,
+                                               graph_search=graph_search, observer=observer,
+                                               successor_cache=successor_cache))
+    return list(iterate_search_BFS(init_state_arg, goal_state_arg, assembly_data_base,
+                                   graph_search=graph_search, partial_order_reduction=partial_order_reduction,
+                                   observer=observer, checkpoint_path=checkpoint_path,
+                                   checkpoint_interval=checkpoint_interval, resume=resume,
+                                   symmetry_reduction=symmetry_reduction, successor_cache=successor_cache))
+
+
+def resume_search_BFS(init_state_arg: State, assembly_data_base: AssemblyGroupDataBase, checkpoint_path: str,
+                      checkpoint_interval: float = 300.0, observer: SearchObserver | None = None) -> list[State]:
+    """체크포인트 파일에서 중단된 BFS를 이어서 수행합니다
+    
+    탐색 옵션(graph_search, partial_order_reduction, symmetry_reduction)은 체크포인트에 저장된 값을 사용하며,
+    이어서 수행하는 동안에도 같은 파일에 체크포인트를 계속 저장합니다.
+    
+    Args:
+        init_state_arg: 초기 상태 (체크포인트를 저장한 탐색과 같은 부품 구조여야 함)
+        assembly_data_base: 조립 규칙 데이터베이스
+        checkpoint_path: 체크포인트 파일 경로
+        checkpoint_interval: 체크포인트 저장 간격(초)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        
+    Returns:
+        중단 전에 발견된 최종 상태들과 이어서 발견한 최종 상태들의 리스트
+        (중단 없이 search_algorithm_BFS를 수행한 결과와 같음)
+    """
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        checkpoint_data: dict = pickle.load(checkpoint_file)
+    return search_algorithm_BFS(init_state_arg, None, assembly_data_base,
+                                graph_search=checkpoint_data["graph_search"],
+                                partial_order_reduction=checkpoint_data["partial_order_reduction"],
+                                observer=observer, checkpoint_path=checkpoint_path,
+                                checkpoint_interval=checkpoint_interval, resume=True,
+                                symmetry_reduction=checkpoint_data.get("symmetry_reduction", False))
+
+
+def iterate_search_BFS(init_state_arg: State, goal_state_arg: State, 
+                       assembly_data_base: AssemblyGroupDataBase,
+                       graph_search: bool = False, partial_order_reduction: bool = False,
+                       observer: SearchObserver | None = None, checkpoint_path: str | None = None,
+                       checkpoint_interval: float = 300.0, resume: bool = False,
+                       symmetry_reduction: bool = False,
+                       successor_cache: SuccessorCache | None = None) -> Iterator[State]:
+    """BFS를 사용하여 가능한 모든 조립 경로를 탐색하고, 최종 상태를 발견 즉시 생성합니다
+    
+    초기 상태에서 시작하여 너비 우선 탐색(BFS)을 통해 
+    모든 가능한 조립 순서를 시뮬레이션합니다.
+    각 상태에서 발견되는 모든 조립 후보에 대해 새로운 상태를 생성하고,
+    더 이상 조립이 불가능한 최종 상태를 발견할 때마다 바로 생성(yield)합니다.
+    최종 상태를 따로 모아두지 않으므로 기본 모드에서 유지되는 메모리는 탐색 큐뿐이며,
+    호출자는 결과를 하나씩 소비하거나 원하는 시점에 탐색을 중단할 수 있습니다.
+    
+    각 최종 상태의 action_sequence_log에는 초기 상태부터 
+    해당 최종 상태에 도달하기까지의 전체 조립 경로가 기록됩니다.
+    
+    graph_search가 True이면 상태 키(get_state_key)를 기준으로 방문 테이블을
+    유지하여, 조립 순서만 다르고 조립 결과가 같은 상태는 한 번만 확장합니다.
+    중복 상태로 들어오는 간선은 버리지 않고 기존 상태의 parent_edge_list에
+    추가되므로, iterate_action_sequences로 모든 조립 경로를 복원할 수 있습니다.
+    이 경우 최종 상태 리스트에는 서로 다른 최종 조립 결과가 하나씩만 담기며,
+    action_sequence_log에는 처음 발견된 경로가 기록됩니다.
+    
+    partial_order_reduction이 True이면 sleep set 기반 부분 순서 감소를 적용합니다.
+    서로 다른 조립부만 사용하는 두 조립은 순서를 바꿔도 같은 상태에 도달하므로,
+    한 상태에서 먼저 탐색한 형제 조립 중 다음 조립과 독립적인 것은
+    자식 상태의 sleep set에 넣어 다시 탐색하지 않습니다.
+    그 결과 독립적인 조립들의 순서 조합마다 대표 순서 하나만 탐색되며,
+    최종 상태 리스트에는 순서만 다른 계획이 하나로 합쳐져 담깁니다.
+    graph_search와 함께 사용하면 (상태 키, sleep set)이 같은 경우만 중복으로 병합합니다.
+    
+    symmetry_reduction이 True이면 같은 조립부 구성을 가진 부품(예: bolt1, bolt2)을
+    서로 바꾸기만 한 상태들을 하나로 취급합니다 (State.get_canonical_state_key 참고).
+    graph_search와 함께 사용하면 방문 테이블을 대표 상태 키로 유지하여 대칭인 상태들 중
+    처음 발견한 상태만 확장하고, 그렇지 않으면 한 상태의 자식 중 서로 대칭인 자식을 하나만 탐색합니다.
+    대칭인 상태로 들어오는 간선은 조립 결과가 다르므로 parent_edge_list에 병합하지 않으며,
+    최종 상태 리스트에는 대칭인 최종 상태 묶음마다 대표 하나만 담깁니다.
+    sleep set은 특정 부품의 조립을 기록하므로 partial_order_reduction과는 함께 사용할 수 없습니다.
+    
+    탐색 루프 안에서는 출력하지 않습니다. 최종 상태마다 로그가 필요하면
+    observer로 PrintSearchObserver를, 지표가 필요하면 SearchMetrics를 전달합니다.
+    
+    checkpoint_path가 주어지면 checkpoint_interval초마다, 그리고 탐색이 끝날 때
+    탐색 큐, 방문 테이블, 탐색 횟수, 이미 생성한 최종 상태를 체크포인트 파일에 저장합니다
+    (_write_BFS_checkpoint 참고). 이 경우 생성한 최종 상태도 체크포인트를 위해 메모리에 유지됩니다.
+    resume이 True이면 체크포인트에서 탐색을 복원하고, 중단 전에 생성했던 최종 상태부터
+    다시 생성한 뒤 탐색을 이어갑니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 상태 (현재 미사용)
+        assembly_data_base: 조립 규칙 데이터베이스
+        graph_search: 중복 상태 병합(그래프 탐색) 사용 여부 (기본값: False)
+        partial_order_reduction: sleep set 기반 부분 순서 감소 사용 여부 (기본값: False)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        checkpoint_path: 체크포인트 파일 경로 (None이면 저장하지 않음)
+        checkpoint_interval: 체크포인트 저장 간격(초)
+        resume: checkpoint_path의 체크포인트에서 탐색을 이어서 수행할지 여부
+            (탐색 옵션은 인자로 주어진 값이 아니라 체크포인트에 저장된 값을 사용)
+        symmetry_reduction: 대칭인 부품의 자리 바꿈만 다른 상태 병합 사용 여부 (기본값: False)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Yields:
+        더 이상 조립이 불가능한 최종 상태 (발견 순서대로)
+    """
+    final_state_count: int = 0
+    # (상태, sleep set): sleep set은 이 상태에서 탐색하지 않을 조립들의 조립부 비트마스크 집합
+    queue: deque[tuple[State, frozenset[int]]] = deque([(init_state_arg, frozenset())])
+    visited_state_dict: dict[tuple[int, frozenset[int]], State] = {
+        (init_state_arg.get_state_key(), frozenset()): init_state_arg}
+    # 체크포인트에 기록할 생성 완료된 최종 상태
+    final_state_list: list[State] = []
+    
+    # 탐색 과정 로깅
+    explored_count: int = 0
+    duplicate_count: int = 0
+    symmetric_count: int = 0
+    exploration_limit: int = 10000000# 무한 반복 한계 설정
+    
+    if resume:
+        search_info: dict = _read_BFS_checkpoint(init_state_arg, checkpoint_path)
+        queue = search_info["queue"]
+        final_state_list = search_info["final_state_list"]
+        graph_search = search_info["graph_search"]
+        partial_order_reduction = search_info["partial_order_reduction"]
+        symmetry_reduction = search_info["symmetry_reduction"]
+        explored_count = search_info["explored_count"]
+        duplicate_count = search_info["duplicate_count"]
+        symmetric_count = search_info["symmetric_count"]
+        final_state_count = len(final_state_list)
+    if partial_order_reduction and symmetry_reduction:
+        raise ValueError("partial_order_reduction과 symmetry_reduction은 함께 사용할 수 없습니다")
+    get_state_key: Callable[[State], int] = State.get_canonical_state_key if symmetry_reduction else State.get_state_key
+    if resume:
+        # 같은 비트마스크의 상태는 항상 같은 깊이에 있으므로, 이미 확장된 상태는 다시 방문되지 않음:
+        # 방문 테이블은 큐에 남은 상태만으로 복원
+        visited_state_dict = {(get_state_key(state), sleep_set): state for state, sleep_set in queue}
+        yield from final_state_list
+    # 새 탐색은 첫 반복에서 바로 체크포인트를 남겨, 시작 직후 중단되어도 이어서 수행할 수 있도록 함
+    last_checkpoint_time: float = time.monotonic() if resume else float("-inf")
+    
+    while queue:
+        if checkpoint_path is not None and time.monotonic() - last_checkpoint_time >= checkpoint_interval:
+            _write_BFS_checkpoint(checkpoint_path, queue, final_state_list,
+                                  {"graph_search": graph_search, "partial_order_reduction": partial_order_reduction,
+                                   "symmetry_reduction": symmetry_reduction, "explored_count": explored_count,
+                                   "duplicate_count": duplicate_count, "symmetric_count": symmetric_count})
+            last_checkpoint_time = time.monotonic()
+        
+        current_state, sleep_set = queue.popleft()
+        explored_count += 1
+        # 무한 반복 방지
+        if explored_count >= exploration_limit:
+            break
+        
+        # 현재 상태에서 가능한 조립 후보 탐색
+        if observer is not None:
+            observer.on_state_expanded(current_state)
+        candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(
+            current_state, assembly_data_base, observer, successor_cache)
+        
+        if len(candidate_match_list) == 0:
+            # 더 이상 조립할 수 없는 최종 상태 도달
+            final_state_count += 1
+            if checkpoint_path is not None:
+                final_state_list.append(current_state)
+            if observer is not None:
+                observer.on_final_state(current_state, explored_count)
+            yield current_state
+        else:
+            # 각 조립 후보에 대해 새로운 상태 생성 및 큐에 추가
+            explored_match_mask_list: list[int] = []
+            # 트리 탐색의 대칭 감소: 이 상태에서 이미 만든 자식 상태들의 대표 상태 키
+            child_canonical_key_set: set[int] = set()
+            for match_info in candidate_match_list:
+                new_sleep_set: frozenset[int] = frozenset()
+                if partial_order_reduction:
+                    match_mask: int = current_state.layout.get_match_mask(match_info)
+                    if match_mask in sleep_set:
+                        # 독립적인 조립 순서만 바뀐 경로: 다른 형제에서 이미 탐색됨
+                        continue
+                    new_sleep_set = frozenset(
+                        sleep_match_mask for sleep_match_mask in (*sleep_set, *explored_match_mask_list)
+                        if sleep_match_mask & match_mask == 0)
+                    explored_match_mask_list.append(match_mask)
+                
+                if graph_search:
+                    child_mask: int = current_state.get_state_key() | current_state.layout.get_match_mask(match_info)
+                    state_key: tuple[int, frozenset[int]] = (
+                        current_state.layout.get_canonical_mask(child_mask) if symmetry_reduction else child_mask,
+                        new_sleep_set)
+                    visited_state: State = visited_state_dict.get(state_key)
+                    if visited_state is not None:
+                        if visited_state.get_assembled_mask() == child_mask:
+                            # 이미 발견된 상태: 간선만 병합하고 다시 확장하지 않음
+                            visited_state.add_parent_edge(current_state, match_info)
+                            duplicate_count += 1
+                        else:
+                            # 이미 발견된 상태와 대칭인 상태: 조립 결과가 다르므로 간선도 병합하지 않음
+                            symmetric_count += 1
+                        if observer is not None:
+                            observer.on_duplicate_state(current_state, match_info)
+                        continue
+                    new_state: State = observe_execute_assemble(current_state, match_info, observer)
+                    visited_state_dict[state_key] = new_state
+                else:
+                    if symmetry_reduction:
+                        child_canonical_key: int = current_state.layout.get_canonical_mask(
+                            current_state.get_state_key() | current_state.layout.get_match_mask(match_info))
+                        if child_canonical_key in child_canonical_key_set:
+                            # 형제 상태와 대칭인 자식: 같은 모양의 하위 트리이므로 탐색하지 않음
+                            symmetric_count += 1
+                            if observer is not None:
+                                observer.on_duplicate_state(current_state, match_info)
+                            continue
+                        child_canonical_key_set.add(child_canonical_key)
+                    new_state = observe_execute_assemble(current_state, match_info, observer)
+                queue.append((new_state, new_sleep_set))
+    
+    if checkpoint_path is not None:
+        _write_BFS_checkpoint(checkpoint_path, queue, final_state_list,
+                              {"graph_search": graph_search, "partial_order_reduction": partial_order_reduction,
+                               "symmetry_reduction": symmetry_reduction, "explored_count": explored_count,
+                               "duplicate_count": duplicate_count, "symmetric_count": symmetric_count})
+    
+    print(f"\n완료: 총 {explored_count}개 상태 탐색, {final_state_count}개 최종 상태 발견")
+    if graph_search:
+        print(f"중복 상태 병합: {duplicate_count}회")
+    if symmetry_reduction:
+        print(f"대칭 상태 병합: {symmetric_count}회")
+
+
+def _get_layout_signature(layout: StateLayout) -> list[tuple[int, str, str]]:
+    """체크포인트 호환성 확인용 부품 구조 정보 (조립부별 부품 인덱스, main_type, sub_type)"""
+    return [(layout.port_item_list[port_bit],
+             layout.main_type_name_list[layout.port_main_type_list[port_bit]],
+             layout.sub_type_name_list[layout.port_sub_type_list[port_bit]])
+            for port_bit in range(layout.port_count)]
+
+
+def _write_BFS_checkpoint(checkpoint_path: str, queue: deque[tuple[State, frozenset[int]]],
+                          final_state_list: list[State], search_info: dict[str, int | bool]) -> None:
+    """BFS 탐색 큐, 최종 상태, 탐색 정보를 체크포인트 파일에 저장합니다
+    
+    상태 객체 대신 큐와 최종 상태에서 parent_edge_list로 거슬러 올라가며 만나는 상태들을
+    (조립부 비트마스크, [(부모 노드 번호, 조립부 비트마스크), ...]) 노드로만 기록하므로,
+    공통 조립 경로는 한 번만 저장되고 그래프 탐색에서 병합된 간선도 모두 보존됩니다.
+    부품 UUID는 기록하지 않으므로 다른 프로세스에서 새로 만든 같은 구조의 부품으로도 복원할 수 있습니다.
+    저장 중 중단되어도 이전 체크포인트가 남도록 임시 파일에 쓴 뒤 교체합니다.
+    
+    Args:
+        checkpoint_path: 체크포인트 파일 경로
+        queue: BFS 탐색 큐
+        final_state_list: 이미 생성한 최종 상태 리스트
+        search_info: 탐색 옵션과 탐색 횟수 (graph_search, partial_order_reduction, symmetry_reduction,
+            explored_count, duplicate_count, symmetric_count)
+    """
+    node_id_dict: dict[int, int] = {}
+    node_state_list: list[State] = []
+    stack: list[State] = [state for state, _ in queue] + final_state_list
+    while stack:
+        state: State = stack.pop()
+        if id(state) in node_id_dict:
+            continue
+        node_id_dict[id(state)] = -1
+        node_state_list.append(state)
+        stack.extend(parent_state for parent_state, _ in state.get_parent_edge_list())
+    # 부모 노드가 먼저 오도록 깊이 순으로 번호 부여
+    node_state_list.sort(key=lambda state: state.get_depth())
+    for node_id, state in enumerate(node_state_list):
+        node_id_dict[id(state)] = node_id
+    
+    layout: StateLayout = node_state_list[0].layout if node_state_list else None
+    node_list: list[tuple[int, list[tuple[int, int]]]] = [
+        (state.get_assembled_mask(),
+         [(node_id_dict[id(parent_state)], layout.get_match_mask(match_info))
+          for parent_state, match_info in state.get_parent_edge_list()])
+        for state in node_state_list]
+    checkpoint_data: dict = {
+        **search_info,
+        "layout_signature": _get_layout_signature(layout) if layout is not None else None,
+        "node_list": node_list,
+        "queue": [(node_id_dict[id(state)], tuple(sleep_set)) for state, sleep_set in queue],
+        "final_node_list": [node_id_dict[id(state)] for state in final_state_list],
+    }
+    
+    temporary_path: str = checkpoint_path + ".tmp"
+    with open(temporary_path, "wb") as checkpoint_file:
+        pickle.dump(checkpoint_data, checkpoint_file, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(temporary_path, checkpoint_path)
+
+
+def _read_BFS_checkpoint(init_state_arg: State, checkpoint_path: str) -> dict:
+    """체크포인트 파일에서 BFS 탐색 큐와 최종 상태를 복원합니다
+    
+    Args:
+        init_state_arg: 초기 상태 (부모 간선이 없는 노드는 이 상태로 복원)
+        checkpoint_path: 체크포인트 파일 경로
+        
+    Returns:
+        _write_BFS_checkpoint의 search_info 항목에 "queue"(복원된 탐색 큐)와
+        "final_state_list"(복원된 최종 상태 리스트)를 더한 딕셔너리
+    """
+    with open(checkpoint_path, "rb") as checkpoint_file:
+        checkpoint_data: dict = pickle.load(checkpoint_file)
+    layout: StateLayout = init_state_arg.layout
+    if checkpoint_data["layout_signature"] not in (None, _get_layout_signature(layout)):
+        raise ValueError(f"체크포인트의 부품 구조가 초기 상태와 다릅니다: {checkpoint_path}")
+    
+    node_state_list: list[State] = []
+    for assembled_mask, parent_edge_list in checkpoint_data["node_list"]:
+        if len(parent_edge_list) == 0:
+            node_state_list.append(init_state_arg)
+            continue
+        parent_id, match_mask = parent_edge_list[0]
+        state: State = node_state_list[parent_id].create_child_state(assembled_mask, layout.get_match_info(match_mask))
+        for parent_id, match_mask in parent_edge_list[1:]:
+            state.add_parent_edge(node_state_list[parent_id], layout.get_match_info(match_mask))
+        node_state_list.append(state)
+    
+    search_info: dict = {key: checkpoint_data[key] for key
+                         in ("graph_search", "partial_order_reduction", "explored_count", "duplicate_count")}
+    # 대칭 감소 이전에 저장된 체크포인트는 해당 항목이 없음
+    search_info["symmetry_reduction"] = checkpoint_data.get("symmetry_reduction", False)
+    search_info["symmetric_count"] = checkpoint_data.get("symmetric_count", 0)
+    search_info["queue"] = deque((node_state_list[node_id], frozenset(sleep_set))
+                                 for node_id, sleep_set in checkpoint_data["queue"])
+    search_info["final_state_list"] = [node_state_list[node_id] for node_id in checkpoint_data["final_node_list"]]
+    return search_info
+
+
+def iterate_search_BFS_on_disk(init_state_arg: State, goal_state_arg: State, 
+                               assembly_data_base: AssemblyGroupDataBase, frontier_directory: str,
+                               graph_search: bool = False, bucket_count: int = 16,
+                               observer: SearchObserver | None = None,
+                               successor_cache: SuccessorCache | None = None) -> Iterator[State]:
+    """탐색 큐와 방문 테이블을 디스크에 두고 BFS를 수행하여, 최종 상태를 발견 즉시 생성합니다
+    
+    각 깊이(layer)의 상태는 frontier_directory의 layer 파일에 고정 길이 레코드
+    (조립부 비트마스크, 이전 layer에서의 부모 레코드 번호)로 추가 기록되고,
+    다음 깊이에서 순서대로 다시 읽어 확장됩니다. 따라서 메모리 사용량은 상태 수와 무관하며
+    탐색 크기는 디스크 용량으로만 제한됩니다 (exploration_limit도 적용하지 않음).
+    
+    조립 결과(비트마스크)가 같으면 사용된 조립 그룹 수도 같으므로, 같은 상태는 항상 같은 깊이에서만
+    나타납니다. graph_search가 True이면 한 깊이의 자식 상태를 비트마스크 해시에 따라
+    bucket_count개의 bucket 파일로 나누어 기록한 뒤, bucket 하나씩 메모리에 올려
+    중복을 제거하고 다음 layer 파일을 만듭니다 (지연 중복 제거).
+    이때 중복 상태로 들어오는 간선은 버려지므로 최종 상태에는 처음 기록된 경로 하나만 남습니다.
+    
+    최종 상태는 부모 레코드 번호를 따라 layer 파일들을 거슬러 읽어 조립 경로를 복원한 뒤 생성합니다.
+    확장 중인 상태는 비트마스크만으로 복원되므로 observer에는 조립 이력이 없는 상태가 전달됩니다.
+    탐색이 끝나면 (또는 생성기가 닫히면) 기록한 layer/bucket 파일은 삭제됩니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 상태 (현재 미사용)
+        assembly_data_base: 조립 규칙 데이터베이스
+        frontier_directory: layer/bucket 파일을 기록할 디렉토리 (없으면 생성)
+        graph_search: 중복 상태 병합(그래프 탐색) 사용 여부 (기본값: False)
+        bucket_count: 중복 제거에 사용할 bucket 파일 개수 (한 깊이 상태 수 / bucket_count만큼 메모리 사용)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Yields:
+        더 이상 조립이 불가능한 최종 상태 (처음 기록된 조립 경로 하나를 가짐)
+    """
+    layout: StateLayout = init_state_arg.layout
+    mask_byte_count: int = (layout.port_count + 7) // 8
+    record_struct = struct.Struct(f"<{mask_byte_count}sQ")
+    os.makedirs(frontier_directory, exist_ok=True)
+    bucket_path_list: list[str] = [os.path.join(frontier_directory, f"bfs_bucket_{bucket_index}.bin")
+                                   for bucket_index in range(bucket_count if graph_search else 0)]
+    layer_path_list: list[str] = [os.path.join(frontier_directory, "bfs_layer_0.bin")]
+    layer_file_list: list[io.BufferedReader] = []
+    
+    final_state_count: int = 0
+    explored_count: int = 0
+    duplicate_count: int = 0
+    
+    try:
+        with open(layer_path_list[0], "wb") as layer_file:
+            layer_file.write(record_struct.pack(init_state_arg.get_assembled_mask().to_bytes(mask_byte_count, "little"), 0))
+        
+        while True:
+            depth: int = len(layer_path_list) - 1
+            layer_file_list.append(open(layer_path_list[depth], "rb"))
+            next_layer_path: str = os.path.join(frontier_directory, f"bfs_layer_{depth + 1}.bin")
+            # 자식 상태 기록 대상: 그래프 탐색이면 bucket 파일, 아니면 다음 layer 파일
+            output_file_list: list[io.BufferedWriter] = [open(path, "wb")
+                                                         for path in (bucket_path_list or [next_layer_path])]
+            child_count: int = 0
+            try:
+                for record_index, (mask_bytes, _) in enumerate(_iterate_frontier_record(layer_path_list[depth],
+                                                                                        record_struct)):
+                    assembled_mask: int = int.from_bytes(mask_bytes, "little")
+                    current_state: State = init_state_arg.create_state_from_mask(assembled_mask)
+                    explored_count += 1
+                    if observer is not None:
+                        observer.on_state_expanded(current_state)
+                    candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(
+                        current_state, assembly_data_base, observer, successor_cache)
+                    
+                    if len(candidate_match_list) == 0:
+                        final_state_count += 1
+                        final_state: State = _restore_frontier_state(init_state_arg, layer_file_list, record_struct,
+                                                                     depth, record_index)
+                        if observer is not None:
+                            observer.on_final_state(final_state, explored_count)
+                        yield final_state
+                        continue
+                    
+                    for match_info in candidate_match_list:
+                        child_mask: int = assembled_mask | layout.get_match_mask(match_info)
+                        output_file_list[hash(child_mask) % len(output_file_list)].write(
+                            record_struct.pack(child_mask.to_bytes(mask_byte_count, "little"), record_index))
+                        child_count += 1
+            finally:
+                for output_file in output_file_list:
+                    output_file.close()
+            
+            if graph_search:
+                # bucket별로 같은 비트마스크의 상태를 하나만 남겨 다음 layer 파일로 합침
+                child_count = 0
+                with open(next_layer_path, "wb") as next_layer_file:
+                    for bucket_path in bucket_path_list:
+                        bucket_record_dict: dict[bytes, int] = {}
+                        for mask_bytes, parent_record_index in _iterate_frontier_record(bucket_path, record_struct):
+                            if mask_bytes in bucket_record_dict:
+                                duplicate_count += 1
+                                if observer is not None:
+                                    observer.on_duplicate_state(
+                                        init_state_arg.create_state_from_mask(int.from_bytes(mask_bytes, "little")),
+                                        [])
+                                continue
+                            bucket_record_dict[mask_bytes] = parent_record_index
+                        for mask_bytes, parent_record_index in bucket_record_dict.items():
+                            next_layer_file.write(record_struct.pack(mask_bytes, parent_record_index))
+                        child_count += len(bucket_record_dict)
+            
+            layer_path_list.append(next_layer_path)
+            if child_count == 0:
+                break
+    finally:
+        for layer_file in layer_file_list:
+            layer_file.close()
+        for path in (*layer_path_list, *bucket_path_list):
+            if os.path.exists(path):
+                os.remove(path)
+    
+    print(f"\n디스크 BFS 완료: 총 {explored_count}개 상태 탐색, {final_state_count}개 최종 상태 발견")
+    if graph_search:
+        print(f"중복 상태 병합: {duplicate_count}회")
+
+
+def _iterate_frontier_record(file_path: str, record_struct: struct.Struct,
+                             chunk_record_count: int = 4096) -> Iterator[tuple[bytes, int]]:
+    """layer/bucket 파일의 (비트마스크 바이트, 부모 레코드 번호) 레코드를 순서대로 읽습니다"""
+    with open(file_path, "rb") as record_file:
+        while True:
+            chunk: bytes = record_file.read(record_struct.size * chunk_record_count)
+            if not chunk:
+                break
+            yield from record_struct.iter_unpack(chunk)
+
+
+def _restore_frontier_state(init_state_arg: State, layer_file_list: list[io.BufferedReader],
+                            record_struct: struct.Struct, depth: int, record_index: int) -> State:
+    """layer 파일의 부모 레코드 번호를 거슬러 올라가 조립 경로를 가진 상태를 복원합니다
+    
+    Args:
+        init_state_arg: 초기 상태 (layer 0의 유일한 레코드)
+        layer_file_list: 깊이별 layer 파일 (임의 접근용)
+        record_struct: 레코드 형식
+        depth: 복원할 상태의 깊이
+        record_index: 복원할 상태의 layer 내 레코드 번호
+        
+    Returns:
+        초기 상태부터의 조립 경로(parent_edge_list, 조립 과정 로그)를 가진 상태
+    """
+    assembled_mask_list: list[int] = []
+    for layer_depth in range(depth, 0, -1):
+        layer_file: io.BufferedReader = layer_file_list[layer_depth]
+        layer_file.seek(record_index * record_struct.size)
+        mask_bytes, record_index = record_struct.unpack(layer_file.read(record_struct.size))
+        assembled_mask_list.append(int.from_bytes(mask_bytes, "little"))
+    
+    state: State = init_state_arg
+    for assembled_mask in reversed(assembled_mask_list):
+        match_info: list[tuple[UUID, int]] = state.layout.get_match_info(assembled_mask & ~state.get_assembled_mask())
+        state = state.create_child_state(assembled_mask, match_info)
+    return state
+
+
+# 병렬 BFS 작업 프로세스가 공유하는 (기준 상태, 조립 규칙 데이터베이스)
+_parallel_worker_context: tuple[State, AssemblyGroupDataBase] | None = None
+
+
+def _init_parallel_worker(item_list: list[Item], assembly_data_base: AssemblyGroupDataBase) -> None:
+    """병렬 BFS 작업 프로세스를 초기화합니다 (프로세스당 1회 부품 구조 생성)"""
+    global _parallel_worker_context
+    _parallel_worker_context = (State(item_list), assembly_data_base)
+
+
+def _expand_state_mask_list(base_state: State, assembly_data_base: AssemblyGroupDataBase, 
+                            assembled_mask_list: list[int]) -> list[list[tuple[list[tuple[int, int]], int]]]:
+    """비트마스크로 전달된 상태들을 확장합니다
+    
+    Args:
+        base_state: 부품 구조를 참조할 기준 상태
+        assembly_data_base: 조립 규칙 데이터베이스
+        assembled_mask_list: 확장할 상태들의 조립부 비트마스크 리스트
+        
+    Returns:
+        상태별 [(조립 정보, 자식 상태 비트마스크), ...] 리스트.
+        조립 정보는 UUID 대신 (부품 인덱스, 조립부 타입 인덱스)로 표현합니다.
+    """
+    layout: StateLayout = base_state.layout
+    successor_list_list: list[list[tuple[list[tuple[int, int]], int]]] = []
+    for assembled_mask in assembled_mask_list:
+        state: State = base_state.create_state_from_mask(assembled_mask)
+        successor_list: list[tuple[list[tuple[int, int]], int]] = []
+        for match_info in check_candidate_match(state, assembly_data_base):
+            member_list: list[tuple[int, int]] = [(layout.get_item_index(item_uuid), assembly_type_index)
+                                                  for item_uuid, assembly_type_index in match_info]
+            successor_list.append((member_list, assembled_mask | layout.get_match_mask(match_info)))
+        successor_list_list.append(successor_list)
+    return successor_list_list
+
+
+def _parallel_expand_worker(assembled_mask_list: list[int]) -> list[list[tuple[list[tuple[int, int]], int]]]:
+    """작업 프로세스에서 상태 묶음을 확장합니다"""
+    base_state, assembly_data_base = _parallel_worker_context
+    return _expand_state_mask_list(base_state, assembly_data_base, assembled_mask_list)
+
+
+def search_algorithm_parallel_BFS(init_state_arg: State, goal_state_arg: State, 
+                                  assembly_data_base: AssemblyGroupDataBase,
+                                  process_count: int | None = None, chunk_size: int = 256,
+                                  observer: SearchObserver | None = None) -> list[State]:
+    """BFS의 각 깊이(layer)를 여러 프로세스에서 나누어 확장합니다
+    
+    같은 깊이의 상태들을 비트마스크로만 작업 프로세스에 보내고, 작업 프로세스는
+    각 상태의 조립 후보와 자식 상태 비트마스크를 돌려줍니다.
+    주 프로세스는 layer 경계에서 같은 비트마스크의 자식 상태를 하나로 병합하고
+    (search_algorithm_BFS의 graph_search와 같이 모든 부모 간선은 유지),
+    다음 layer를 다시 작업 프로세스에 나누어 보냅니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 상태 (현재 미사용)
+        assembly_data_base: 조립 규칙 데이터베이스
+        process_count: 작업 프로세스 수 (기본값: CPU 개수)
+        chunk_size: 작업 프로세스에 한 번에 보내는 상태 개수
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음).
+            조립 후보 탐색과 상태 생성은 작업 프로세스에서 수행되므로 소요 시간은 0으로 전달됩니다.
+        
+    Returns:
+        서로 다른 최종 상태들의 리스트 (graph_search=True인 BFS와 같은 결과)
+    """
+    if process_count is None:
+        process_count = os.cpu_count() or 1
+    
+    item_list: list[Item] = init_state_arg.get_item_state_list()
+    final_state_list: list[State] = []
+    layer_state_dict: dict[int, State] = {init_state_arg.get_state_key(): init_state_arg}
+    visited_state_dict: dict[int, State] = layer_state_dict.copy()
+    
+    explored_count: int = 0
+    duplicate_count: int = 0
+    exploration_limit: int = 10000000# 무한 반복 한계 설정
+    
+    with multiprocessing.Pool(process_count, _init_parallel_worker, (item_list, assembly_data_base)) as pool:
+        while layer_state_dict and explored_count < exploration_limit:
+            assembled_mask_list: list[int] = list(layer_state_dict)[:exploration_limit - explored_count]
+            explored_count += len(assembled_mask_list)
+            
+            # layer를 chunk_size 단위로 나누어 병렬 확장
+            chunk_list: list[list[int]] = [assembled_mask_list[index:index + chunk_size]
+                                           for index in range(0, len(assembled_mask_list), chunk_size)]
+            successor_list_list: list[list[tuple[list[tuple[int, int]], int]]] = [
+                successor_list
+                for chunk_result in pool.map(_parallel_expand_worker, chunk_list)
+                for successor_list in chunk_result]
+            
+            # layer 경계에서 중복 상태 병합
+            next_layer_state_dict: dict[int, State] = {}
+            for assembled_mask, successor_list in zip(assembled_mask_list, successor_list_list):
+                current_state: State = layer_state_dict[assembled_mask]
+                match_info_list: list[list[tuple[UUID, int]]] = [
+                    [(item_list[item_index].get_uuid(), assembly_type_index)
+                     for item_index, assembly_type_index in member_list]
+                    for member_list, _ in successor_list]
+                if observer is not None:
+                    observer.on_state_expanded(current_state)
+                    # 후보 탐색 시간은 작업 프로세스에서 소요되므로 집계하지 않음
+                    observer.on_candidates_generated(current_state, match_info_list, 0.0)
+                if len(successor_list) == 0:
+                    final_state_list.append(current_state)
+                    if observer is not None:
+                        observer.on_final_state(current_state, explored_count)
+                    continue
+                for match_info, (_, child_mask) in zip(match_info_list, successor_list):
+                    visited_state: State = visited_state_dict.get(child_mask)
+                    if visited_state is not None:
+                        visited_state.add_parent_edge(current_state, match_info)
+                        duplicate_count += 1
+                        if observer is not None:
+                            observer.on_duplicate_state(current_state, match_info)
+                        continue
+                    new_state: State = current_state.create_child_state(child_mask, match_info)
+                    if observer is not None:
+                        observer.on_state_created(current_state, new_state, 0.0)
+                    visited_state_dict[child_mask] = new_state
+                    next_layer_state_dict[child_mask] = new_state
+            layer_state_dict = next_layer_state_dict
+    
+    print(f"\n병렬 BFS 완료: 총 {explored_count}개 상태 탐색, {len(final_state_list)}개 최종 상태 발견, "
+          f"중복 상태 병합: {duplicate_count}회 (프로세스 {process_count}개)")
+    
+    return final_state_list
+
+
+def compare_parallel_BFS_speedup(init_state_arg: State, goal_state_arg: State, 
+                                 assembly_data_base: AssemblyGroupDataBase,
+                                 process_count: int | None = None) -> dict[str, float]:
+    """직렬 BFS(graph_search)와 병렬 BFS의 수행 시간을 비교합니다
+    
+    두 탐색의 출력은 측정에서 제외하고, 최종 상태 개수가 같은지 함께 확인합니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 상태 (현재 미사용)
+        assembly_data_base: 조립 규칙 데이터베이스
+        process_count: 병렬 BFS 작업 프로세스 수 (기본값: CPU 개수)
+        
+    Returns:
+        {"serial_time": 직렬 수행 시간(초), "parallel_time": 병렬 수행 시간(초), "speedup": 속도 향상 배율}
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start_time: float = time.perf_counter()
+        serial_final_state_list = search_algorithm_BFS(init_state_arg, goal_state_arg, assembly_data_base,
+                                                       graph_search=True)
+        serial_time: float = time.perf_counter() - start_time
+        
+        start_time = time.perf_counter()
+        parallel_final_state_list = search_algorithm_parallel_BFS(init_state_arg, goal_state_arg, assembly_data_base,
+                                                                  process_count=process_count)
+        parallel_time: float = time.perf_counter() - start_time
+    
+    speedup: float = serial_time / parallel_time if parallel_time > 0 else float("inf")
+    print(f"직렬 BFS: {serial_time:.3f}초 ({len(serial_final_state_list)}개 최종 상태)")
+    print(f"병렬 BFS: {parallel_time:.3f}초 ({len(parallel_final_state_list)}개 최종 상태)")
+    print(f"속도 향상: {speedup:.2f}배")
+    
+    return {"serial_time": serial_time, "parallel_time": parallel_time, "speedup": speedup}
+
+
+def iterate_action_sequences(state: State) -> Iterator[list[list[tuple[UUID, int]]]]:
+    """parent_edge_list를 따라 초기 상태부터 주어진 상태까지의 모든 조립 경로를 생성합니다
+    
+    그래프 탐색(graph_search)으로 병합된 상태는 여러 부모 간선을 가지므로,
+    각 간선 조합마다 하나의 조립 순서를 순차적으로 생성합니다.
+    
+    Args:
+        state: 경로를 복원할 상태
+        
+    Yields:
+        초기 상태부터의 조립 액션 리스트 (action_sequence_log와 같은 형태)
+    """
+    parent_edge_list = state.get_parent_edge_list()
+    if len(parent_edge_list) == 0:
+        # 초기 상태 도달
+        yield []
+        return
+    
+    for parent_state, match_info in parent_edge_list:
+        for action_sequence in iterate_action_sequences(parent_state):
+            yield action_sequence + [match_info]
+
+
+class AssemblyStateGraph:
+    """탐색한 상태 공간을 간결한 인접 리스트로 저장한 DAG (build_state_graph 결과)
+    
+    노드는 서로 다른 조립 결과(비트마스크), 간선은 조립(조립부 비트마스크)입니다.
+    State 객체나 조립 로그 없이 정수 리스트만 유지하며, 간선은 노드 순서대로
+    edge_offset_list 구간에 나뉘어 저장됩니다 (CSR 형식).
+    노드 번호는 BFS 발견 순서이고 조립할수록 깊이가 늘어나므로, 모든 간선은 번호가 작은
+    노드에서 큰 노드로 향합니다 (노드 번호 순서가 위상 순서).
+    
+    Attributes:
+        layout (StateLayout): 비트마스크를 해석할 부품 구조
+        init_state (State): 0번 노드에 해당하는 초기 상태
+        node_mask_list (list[int]): 노드 번호 -> 조립부 비트마스크
+        node_id_dict (dict[int, int]): 조립부 비트마스크 -> 노드 번호
+        edge_offset_list (list[int]): 노드 번호 -> 나가는 간선의 시작 위치 (마지막 원소는 전체 간선 수)
+        edge_target_list (list[int]): 간선 -> 도착 노드 번호
+        edge_match_mask_list (list[int]): 간선 -> 조립에 사용된 조립부 비트마스크
+        node_first_edge_list (list[int]): 노드 번호 -> 처음 발견된 들어오는 간선 (0번 노드는 -1)
+        terminal_node_list (list[int]): 더 이상 조립이 불가능한 노드 번호 리스트 (발견 순서)
+    """
+    
+    def __init__(self, init_state: State) -> None:
+        """AssemblyStateGraph 초기화 (초기 상태 노드 하나만 가진 그래프)
+        
+        Args:
+            init_state: 초기 상태
+        """
+        self.layout: StateLayout = init_state.layout
+        self.init_state: State = init_state
+        self.node_mask_list: list[int] = [init_state.get_assembled_mask()]
+        self.node_id_dict: dict[int, int] = {init_state.get_assembled_mask(): 0}
+        self.edge_offset_list: list[int] = [0]
+        self.edge_target_list: list[int] = []
+        self.edge_match_mask_list: list[int] = []
+        self.node_first_edge_list: list[int] = [-1]
+        self.terminal_node_list: list[int] = []
+
+    def get_node_count(self) -> int:
+        """노드(서로 다른 조립 결과) 수를 반환합니다"""
+        return len(self.node_mask_list)
+
+    def get_edge_count(self) -> int:
+        """간선(조립) 수를 반환합니다"""
+        return len(self.edge_target_list)
+
+    def get_node_mask(self, node_id: int) -> int:
+        """노드의 조립부 비트마스크를 반환합니다"""
+        return self.node_mask_list[node_id]
+
+    def get_node_id(self, assembled_mask: int) -> int:
+        """조립부 비트마스크에 해당하는 노드 번호를 반환합니다"""
+        return self.node_id_dict[assembled_mask]
+
+    def get_terminal_node_list(self) -> list[int]:
+        """최종 상태 노드 번호 리스트를 반환합니다"""
+        return self.terminal_node_list
+
+    def iterate_edge(self, node_id: int) -> Iterator[tuple[int, int]]:
+        """노드에서 나가는 간선을 (도착 노드 번호, 조립부 비트마스크)로 생성합니다"""
+        for edge_index in range(self.edge_offset_list[node_id], self.edge_offset_list[node_id + 1]):
+            yield self.edge_target_list[edge_index], self.edge_match_mask_list[edge_index]
+
+    def get_match_info(self, match_mask: int) -> list[tuple[UUID, int]]:
+        """간선의 조립부 비트마스크를 조립 정보로 변환합니다"""
+        return self.layout.get_match_info(match_mask)
+
+    def _get_path_count_to_list(self, target_node_id: int | None) -> list[int]:
+        """노드별로 target 노드(None이면 모든 최종 노드)까지 가는 경로 수를 역위상 순서로 계산합니다"""
+        path_count_list: list[int] = [0] * len(self.node_mask_list)
+        for node_id in reversed(range(len(self.node_mask_list))):
+            if (node_id == target_node_id if target_node_id is not None
+                    else self.edge_offset_list[node_id] == self.edge_offset_list[node_id + 1]):
+                path_count_list[node_id] = 1
+                continue
+            path_count_list[node_id] = sum(
+                path_count_list[self.edge_target_list[edge_index]]
+                for edge_index in range(self.edge_offset_list[node_id], self.edge_offset_list[node_id + 1]))
+        return path_count_list
+
+    def _get_path_count_from_list(self) -> list[int]:
+        """노드별로 초기 상태에서 해당 노드까지 오는 경로 수를 위상 순서로 계산합니다"""
+        path_count_list: list[int] = [0] * len(self.node_mask_list)
+        path_count_list[0] = 1
+        for node_id in range(len(self.node_mask_list)):
+            for edge_index in range(self.edge_offset_list[node_id], self.edge_offset_list[node_id + 1]):
+                path_count_list[self.edge_target_list[edge_index]] += path_count_list[node_id]
+        return path_count_list
+
+    def count_paths(self, target_node_id: int | None = None) -> int:
+        """초기 상태에서의 조립 순서 수를 경로를 나열하지 않고 셉니다
+        
+        Args:
+            target_node_id: 도착 노드 번호 (None이면 모든 최종 노드까지의 조립 순서 수,
+                즉 count_assembly_plans와 같은 값)
+        """
+        return self._get_path_count_to_list(target_node_id)[0]
+
+    def get_terminal_path_count_dict(self) -> dict[int, int]:
+        """{최종 상태 비트마스크: 조립 순서 수}를 반환합니다 (count_assembly_plans(per_terminal=True)와 같음)"""
+        path_count_list: list[int] = self._get_path_count_from_list()
+        return {self.node_mask_list[node_id]: path_count_list[node_id] for node_id in self.terminal_node_list}
+
+    def get_match_plan_count_dict(self) -> dict[int, int]:
+        """조립(조립부 비트마스크)별로 그 조립을 포함하는 전체 조립 순서 수를 반환합니다
+        
+        간선 (u -> v)를 지나는 조립 순서 수는 (초기 상태 -> u 경로 수) x (v -> 최종 상태 경로 수)이며,
+        하나의 조립 순서는 같은 조립을 두 번 포함하지 않으므로 조립별로 합산합니다.
+        값이 count_paths()와 같은 조립은 모든 조립 순서에 반드시 포함되고, 작은 조립은 선택적입니다.
+        
+        Returns:
+            {조립부 비트마스크: 해당 조립을 포함하는 조립 순서 수} (get_match_info로 조립 정보 변환)
+        """
+        path_count_from_list: list[int] = self._get_path_count_from_list()
+        path_count_to_list: list[int] = self._get_path_count_to_list(None)
+        match_plan_count_dict: dict[int, int] = {}
+        for node_id in range(len(self.node_mask_list)):
+            for target_node_id, match_mask in self.iterate_edge(node_id):
+                match_plan_count_dict[match_mask] = (match_plan_count_dict.get(match_mask, 0)
+                                                     + path_count_from_list[node_id] * path_count_to_list[target_node_id])
+        return match_plan_count_dict
+
+    def iterate_paths(self, target_node_id: int | None = None) -> Iterator[list[list[tuple[UUID, int]]]]:
+        """초기 상태에서의 조립 순서를 하나씩 생성합니다
+        
+        경로 수를 먼저 계산해 target에 도달하지 못하는 간선은 따라가지 않으므로,
+        생성되는 조립 순서마다 비용은 경로 길이에 비례합니다.
+        
+        Args:
+            target_node_id: 도착 노드 번호 (None이면 모든 최종 노드)
+            
+        Yields:
+            조립 액션 리스트 (action_sequence_log와 같은 형태)
+        """
+        path_count_list: list[int] = self._get_path_count_to_list(target_node_id)
+        if path_count_list[0] == 0:
+            return
+        match_mask_path: list[int] = []
+        # (노드 번호, 다음에 살펴볼 간선 위치)
+        stack: list[list[int]] = [[0, self.edge_offset_list[0]]]
+        while stack:
+            node_id, edge_index = stack[-1]
+            if edge_index == self.edge_offset_list[node_id] and (
+                    node_id == target_node_id if target_node_id is not None
+                    else self.edge_offset_list[node_id] == self.edge_offset_list[node_id + 1]):
+                yield [self.get_match_info(match_mask) for match_mask in match_mask_path]
+                if target_node_id is not None:
+                    # target 이후로는 도착할 수 없으므로 더 내려가지 않음
+                    stack[-1][1] = self.edge_offset_list[node_id + 1]
+            if stack[-1][1] >= self.edge_offset_list[node_id + 1]:
+                stack.pop()
+                if match_mask_path:
+                    match_mask_path.pop()
+                continue
+            stack[-1][1] += 1
+            next_node_id: int = self.edge_target_list[edge_index]
+            if path_count_list[next_node_id] == 0:
+                continue
+            match_mask_path.append(self.edge_match_mask_list[edge_index])
+            stack.append([next_node_id, self.edge_offset_list[next_node_id]])
+
+    def get_path(self, node_id: int) -> list[list[tuple[UUID, int]]]:
+        """초기 상태에서 노드까지 처음 발견된 조립 순서 하나를 반환합니다"""
+        match_mask_path: list[int] = []
+        while self.node_first_edge_list[node_id] >= 0:
+            edge_index: int = self.node_first_edge_list[node_id]
+            match_mask_path.append(self.edge_match_mask_list[edge_index])
+            node_id = bisect.bisect_right(self.edge_offset_list, edge_index) - 1
+        return [self.get_match_info(match_mask) for match_mask in reversed(match_mask_path)]
+
+    def create_state(self, node_id: int) -> State:
+        """노드의 상태를 get_path의 조립 순서를 기록한 State로 생성합니다"""
+        state: State = self.init_state
+        for match_info in self.get_path(node_id):
+            state = execute_assemble(state, match_info)
+        return state
+
+
+def build_state_graph(init_state_arg: State, assembly_data_base: AssemblyGroupDataBase,
+                      observer: SearchObserver | None = None,
+                      successor_cache: SuccessorCache | None = None) -> AssemblyStateGraph:
+    """BFS로 상태 공간 전체를 탐색하여 AssemblyStateGraph로 반환합니다
+    
+    그래프 탐색(graph_search=True)과 같은 상태를 확장하지만, 최종 상태마다 State와 조립 로그를
+    남기는 대신 서로 다른 조립 결과를 노드로, 모든 조립을 간선으로 기록합니다.
+    같은 조립 결과는 항상 같은 깊이에 있으므로 State 객체는 현재 깊이와 다음 깊이의 것만 유지되며,
+    결과는 정수 리스트만으로 이루어집니다.
+    조립 순서는 AssemblyStateGraph의 iterate_paths, count_paths, get_path로 얻습니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        assembly_data_base: 조립 규칙 데이터베이스
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Returns:
+        탐색한 상태 공간 DAG
+    """
+    state_graph = AssemblyStateGraph(init_state_arg)
+    layer_state_list: list[State] = [init_state_arg]
+    
+    explored_count: int = 0
+    duplicate_count: int = 0
+    exploration_limit: int = 10000000# 무한 반복 한계 설정
+    
+    while layer_state_list and explored_count < exploration_limit:
+        next_layer_state_list: list[State] = []
+        for current_state in layer_state_list:
+            # 노드는 발견 순서대로 확장되므로 간선도 노드 순서대로 추가됨
+            node_id: int = len(state_graph.edge_offset_list) - 1
+            explored_count += 1
+            if observer is not None:
+                observer.on_state_expanded(current_state)
+            candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(
+                current_state, assembly_data_base, observer, successor_cache)
+            # 부모 상태는 후보 탐색(부모 대비 변경분 계산)에만 필요하므로 참조를 끊어 이전 깊이를 해제
+            current_state.parent_edge_list = []
+            
+            if len(candidate_match_list) == 0:
+                state_graph.terminal_node_list.append(node_id)
+                if observer is not None:
+                    observer.on_final_state(current_state, explored_count)
+            for match_info in candidate_match_list:
+                match_mask: int = current_state.layout.get_match_mask(match_info)
+                child_mask: int = current_state.get_assembled_mask() | match_mask
+                child_node_id: int | None = state_graph.node_id_dict.get(child_mask)
+                if child_node_id is None:
+                    child_node_id = len(state_graph.node_mask_list)
+                    state_graph.node_id_dict[child_mask] = child_node_id
+                    state_graph.node_mask_list.append(child_mask)
+                    state_graph.node_first_edge_list.append(len(state_graph.edge_target_list))
+                    next_layer_state_list.append(observe_execute_assemble(current_state, match_info, observer))
+                else:
+                    duplicate_count += 1
+                    if observer is not None:
+                        observer.on_duplicate_state(current_state, match_info)
+                state_graph.edge_target_list.append(child_node_id)
+                state_graph.edge_match_mask_list.append(match_mask)
+            state_graph.edge_offset_list.append(len(state_graph.edge_target_list))
+            
+            if explored_count >= exploration_limit:
+                break
+        layer_state_list = next_layer_state_list
+    
+    # 탐색 한계로 중단된 경우 확장하지 못한 노드는 나가는 간선이 없는 것으로 기록
+    state_graph.edge_offset_list.extend([len(state_graph.edge_target_list)]
+                                        * (len(state_graph.node_mask_list) + 1 - len(state_graph.edge_offset_list)))
+    
+    print(f"\n상태 그래프 생성 완료: 노드 {state_graph.get_node_count()}개, 간선 {state_graph.get_edge_count()}개, "
+          f"{len(state_graph.terminal_node_list)}개 최종 상태 발견")
+    print(f"중복 상태 병합: {duplicate_count}회")
+    return state_graph
+
+
+def search_algorithm_beam(init_state_arg: State, goal_state_arg: State | Iterable[str | tuple[UUID, int]] | None,
+                          assembly_data_base: AssemblyGroupDataBase, beam_width: int = 8,
+                          score_function: Callable[[State, AssemblyGroupDataBase], float] | None = None,
+                          observer: SearchObserver | None = None,
+                          successor_cache: SuccessorCache | None = None) -> list[State]:
+    """빔 탐색(beam search)으로 깊이마다 점수가 높은 상태 K개만 유지하며 조립 계획을 찾습니다
+    
+    각 깊이에서 빔에 남은 상태들의 자식 상태를 모두 만든 뒤, 중복 상태를 병합하고
+    score_function 점수가 높은 beam_width개만 다음 깊이로 넘깁니다.
+    탐색 상태 수는 (최대 깊이 x beam_width x 분기 수)로 제한되므로,
+    beam_width로 계획 품질과 수행 시간/메모리 사이를 예측 가능하게 조절할 수 있습니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 (get_goal_port_mask 참고).
+            None이면 더 이상 조립이 불가능한 최종 상태를 목표로 합니다.
+        assembly_data_base: 조립 규칙 데이터베이스
+        beam_width: 깊이마다 유지할 상태 개수 K (기본값: 8)
+        score_function: (상태, 조립 규칙 데이터베이스) -> 점수 (클수록 우선).
+            None이면 목표가 있을 때는 남은 최소 조립 횟수가 적을수록,
+            목표가 없을 때는 조립에 사용된 조립부가 많을수록 높은 점수를 줍니다.
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Returns:
+        목표를 만족하는 상태들의 리스트 (점수 내림차순).
+        목표가 있으면 목표를 처음 만족한 깊이의 상태들, 
+        없으면 탐색 중 빔에 들어온 모든 최종 상태들입니다.
+    """
+    goal_mask: int | None = None if goal_state_arg is None else get_goal_port_mask(init_state_arg, goal_state_arg)
+    if score_function is None:
+        if goal_mask is None:
+            score_function = lambda state, _: state.get_assembled_mask().bit_count()
+        else:
+            score_function = lambda state, data_base: -estimate_remaining_assemble_count(state, goal_mask, data_base)
+    
+    found_state_list: list[tuple[float, State]] = []
+    beam_state_list: list[State] = [init_state_arg]
+    explored_count: int = 0
+    
+    while beam_state_list:
+        next_state_dict: dict[int, State] = {}
+        for current_state in beam_state_list:
+            explored_count += 1
+            if goal_mask is not None and goal_mask & ~current_state.get_assembled_mask() == 0:
+                found_state_list.append((score_function(current_state, assembly_data_base), current_state))
+                if observer is not None:
+                    observer.on_final_state(current_state, explored_count)
+                continue
+            
+            if observer is not None:
+                observer.on_state_expanded(current_state)
+            candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(
+                current_state, assembly_data_base, observer, successor_cache)
+            if len(candidate_match_list) == 0:
+                if goal_mask is None:
+                    found_state_list.append((score_function(current_state, assembly_data_base), current_state))
+                    if observer is not None:
+                        observer.on_final_state(current_state, explored_count)
+                continue
+            
+            for match_info, child_state in iterate_successor(current_state, assembly_data_base,
+                                                             candidate_match_list, observer):
+                # 같은 깊이에서 같은 상태는 하나만 유지
+                if next_state_dict.setdefault(child_state.get_state_key(), child_state) is not child_state:
+                    if observer is not None:
+                        observer.on_duplicate_state(current_state, match_info)
+        
+        if goal_mask is not None and found_state_list:
+            break
+        
+        # 점수가 높은 beam_width개의 상태만 다음 깊이로
+        beam_state_list = heapq.nlargest(beam_width, next_state_dict.values(),
+                                         key=lambda state: score_function(state, assembly_data_base))
+    
+    found_state_list.sort(key=lambda scored_state: scored_state[0], reverse=True)
+    print(f"빔 탐색 완료 (beam_width={beam_width}): 총 {explored_count}개 상태 탐색, "
+          f"{len(found_state_list)}개 상태 발견")
+    
+    return [state for _, state in found_state_list]
+
+
+def count_assembly_plans(init_state_arg: State, assembly_data_base: AssemblyGroupDataBase,
+                         per_terminal: bool = False, observer: SearchObserver | None = None,
+                         symmetry_reduction: bool = False) -> int | dict[int, int]:
+    """가능한 조립 순서(계획)의 개수를 계획을 나열하지 않고 정확히 셉니다
+    
+    상태 키(get_state_key)별로 "이 상태에서 최종 상태까지 가는 조립 순서의 수"를
+    메모이제이션하는 상태 DAG 위의 동적 계획법입니다.
+    각 상태는 한 번만 확장되므로 비용은 서로 다른 상태 수에 비례하며,
+    결과는 search_algorithm_BFS가 반환하는 최종 상태 수와 같습니다.
+    깊은 문제에서도 재귀 한계에 걸리지 않도록 명시적 스택으로 후위 순회합니다.
+    
+    symmetry_reduction이 True이면 대표 상태 키(get_canonical_state_key)로 메모이제이션합니다.
+    대칭인 상태들은 최종 상태까지의 조립 순서 수가 같으므로 전체 개수는 그대로이고,
+    대칭인 부품이 많을수록 확장하는 상태 수가 크게 줄어듭니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        assembly_data_base: 조립 규칙 데이터베이스
+        per_terminal: True이면 최종 상태(조립 결과)별 조립 순서 수를 반환 (기본값: False)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        symmetry_reduction: 대칭인 부품의 자리 바꿈만 다른 상태를 하나로 세는지 여부 (기본값: False)
+        
+    Returns:
+        전체 조립 순서 수 (Python 정수이므로 크기 제한 없음).
+        per_terminal이 True이면 {최종 상태 키(assembled_mask): 조립 순서 수} 딕셔너리
+        (init_state_arg.create_state_from_mask로 최종 상태를 복원할 수 있음).
+        symmetry_reduction과 함께 사용하면 대칭인 최종 상태들의 조립 순서 수는
+        대표 비트마스크(StateLayout.get_canonical_mask) 하나에 합산됩니다.
+    """
+    get_state_key: Callable[[State], int] = State.get_canonical_state_key if symmetry_reduction else State.get_state_key
+    plan_count_dict: dict[int, int | dict[int, int]] = {}
+    explored_count: int = 0
+    # (상태, 자식 상태 키 리스트): 자식 상태 키 리스트가 None이면 아직 확장하지 않은 상태
+    stack: list[tuple[State, list[int] | None]] = [(init_state_arg, None)]
+    
+    while stack:
+        current_state, child_key_list = stack[-1]
+        state_key: int = get_state_key(current_state)
+        
+        if child_key_list is None:
+            if state_key in plan_count_dict:
+                if observer is not None:
+                    observer.on_duplicate_state(current_state, current_state.get_parent_edge_list()[0][1])
+                stack.pop()
+                continue
+            explored_count += 1
+            if observer is not None:
+                observer.on_state_expanded(current_state)
+            candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(
+                current_state, assembly_data_base, observer)
+            if len(candidate_match_list) == 0:
+                # 최종 상태: 조립 순서 1개
+                plan_count_dict[state_key] = {state_key: 1} if per_terminal else 1
+                if observer is not None:
+                    observer.on_final_state(current_state, explored_count)
+                stack.pop()
+                continue
+            
+            child_state_list: list[State] = [child_state for _, child_state
+                                             in iterate_successor(current_state, assembly_data_base,
+                                                                  candidate_match_list, observer)]
+            stack[-1] = (current_state, [get_state_key(child_state) for child_state in child_state_list])
+            for child_state in child_state_list:
+                if get_state_key(child_state) not in plan_count_dict:
+                    stack.append((child_state, None))
+                elif observer is not None:
+                    observer.on_duplicate_state(current_state, child_state.get_parent_edge_list()[0][1])
+            continue
+        
+        # 모든 자식 상태의 개수가 계산됨: 합산
+        if per_terminal:
+            terminal_count_dict: dict[int, int] = {}
+            for child_key in child_key_list:
+                for terminal_key, plan_count in plan_count_dict[child_key].items():
+                    terminal_count_dict[terminal_key] = terminal_count_dict.get(terminal_key, 0) + plan_count
+            plan_count_dict[state_key] = terminal_count_dict
+        else:
+            plan_count_dict[state_key] = sum(plan_count_dict[child_key] for child_key in child_key_list)
+        stack.pop()
+    
+    return plan_count_dict[get_state_key(init_state_arg)]
+
+
+def decompose_independent_subproblem(init_state_arg: State, 
+                                     assembly_data_base: AssemblyGroupDataBase) -> list[State]:
+    """서로 조립부를 공유하지 않는 독립 부분 문제로 분할합니다
+    
+    부품을 정점, 조립 그룹(main_type)을 하이퍼엣지로 하는 그래프를 만들어 연결 요소로 나눕니다.
+    하나의 조립에 사용되는 조립부는 모두 같은 main_type이므로, 아직 조립되지 않았고
+    조립 규칙에 포함된 sub_type을 가진 조립부끼리만 같은 부분 문제로 묶으면
+    서로 다른 부분 문제의 부품은 절대 함께 조립되지 않습니다.
+    따라서 전체 상태 공간은 부분 문제 상태 공간들의 곱이며, 각 부분 문제를 따로 탐색한 뒤
+    iterate_combined_final_state, count_decomposed_assembly_plans로 결과를 합칠 수 있습니다.
+    조립 가능한 조립부가 없는 부품은 어떤 부분 문제에도 포함되지 않습니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        assembly_data_base: 조립 규칙 데이터베이스
+        
+    Returns:
+        부분 문제별 초기 상태 리스트 (가장 작은 부품 인덱스 순).
+        각 초기 상태는 해당 부품만 가진 새 StateLayout을 사용하며, 같은 Item 객체를 참조하므로
+        조립 정보의 (UUID, 조립부 타입 인덱스)는 원래 문제에서도 그대로 유효합니다.
+    """
+    layout: StateLayout = init_state_arg.layout
+    compiled_problem: CompiledProblem = layout.get_compiled_problem(assembly_data_base)
+    init_mask: int = init_state_arg.get_assembled_mask()
+    item_count: int = len(layout.port_offset_list)
+    
+    # 부품 인덱스 union-find: 같은 조립 그룹에 쓰일 수 있는 조립부를 가진 부품끼리 합침
+    item_root_list: list[int] = list(range(item_count))
+    
+    def find_root(item_index: int) -> int:
+        while item_root_list[item_index] != item_index:
+            item_root_list[item_index] = item_root_list[item_root_list[item_index]]
+            item_index = item_root_list[item_index]
+        return item_index
+    
+    group_first_item_dict: dict[int, int] = {}
+    active_item_set: set[int] = set()
+    for port_bit in range(layout.port_count):
+        if init_mask >> port_bit & 1:
+            continue
+        main_type_id: int = layout.port_main_type_list[port_bit]
+        required_sub_type_tuple: tuple[int, ...] | None = compiled_problem.group_required_sub_type_list[main_type_id]
+        if required_sub_type_tuple is None or layout.port_sub_type_list[port_bit] not in required_sub_type_tuple:
+            continue
+        item_index: int = layout.port_item_list[port_bit]
+        active_item_set.add(item_index)
+        first_item_index: int = group_first_item_dict.setdefault(main_type_id, item_index)
+        item_root_list[find_root(item_index)] = find_root(first_item_index)
+    
+    component_item_dict: dict[int, list[int]] = {}
+    for item_index in sorted(active_item_set):
+        component_item_dict.setdefault(find_root(item_index), []).append(item_index)
+    
+    subproblem_init_state_list: list[State] = []
+    for component_item_list in component_item_dict.values():
+        sub_layout = StateLayout([layout.item_list[item_index] for item_index in component_item_list])
+        sub_layout.candidate_backend = layout.candidate_backend
+        # 원래 문제의 초기 비트마스크를 부분 문제의 비트 위치로 옮김
+        sub_init_mask: int = 0
+        for sub_item_index, item_index in enumerate(component_item_list):
+            port_offset: int = layout.port_offset_list[item_index]
+            item_port_count: int = (layout.port_offset_list[item_index + 1] if item_index + 1 < item_count
+                                    else layout.port_count) - port_offset
+            sub_init_mask |= ((init_mask >> port_offset & ((1 << item_port_count) - 1))
+                              << sub_layout.port_offset_list[sub_item_index])
+        template_state: State = State.__new__(State)
+        template_state.layout = sub_layout
+        template_state.item_state_list = sub_layout.item_list
+        subproblem_init_state_list.append(template_state.create_state_from_mask(sub_init_mask))
+    return subproblem_init_state_list
+
+
+def search_algorithm_decomposed_BFS(init_state_arg: State, goal_state_arg: State, 
+                                    assembly_data_base: AssemblyGroupDataBase,
+                                    graph_search: bool = False, symmetry_reduction: bool = False,
+                                    observer: SearchObserver | None = None) -> list[list[State]]:
+    """독립 부분 문제로 분할한 뒤 부분 문제마다 BFS를 수행합니다
+    
+    탐색 비용은 부분 문제 상태 수의 곱이 아니라 합에 비례합니다.
+    전체 문제의 최종 상태(조립 순서)가 필요하면 결과를 iterate_combined_final_state에 전달합니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 상태 (현재 미사용)
+        assembly_data_base: 조립 규칙 데이터베이스
+        graph_search: 부분 문제 탐색에 중복 상태 병합(그래프 탐색) 사용 여부 (기본값: False)
+        symmetry_reduction: 부분 문제 탐색에 대칭 감소 사용 여부 (기본값: False)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        
+    Returns:
+        부분 문제별 최종 상태 리스트의 리스트 (decompose_independent_subproblem 순서)
+    """
+    subproblem_init_state_list: list[State] = decompose_independent_subproblem(init_state_arg, assembly_data_base)
+    print(f"\n독립 부분 문제 {len(subproblem_init_state_list)}개로 분할 "
+          f"(부품 수: {[len(state.get_item_state_list()) for state in subproblem_init_state_list]})")
+    return [search_algorithm_BFS(subproblem_init_state, goal_state_arg, assembly_data_base,
+                                 graph_search=graph_search, symmetry_reduction=symmetry_reduction, observer=observer)
+            for subproblem_init_state in subproblem_init_state_list]
+
+
+def iterate_combined_final_state(init_state_arg: State, component_final_state_list_list: list[list[State]],
+                                 interleave: bool = True) -> Iterator[State]:
+    """부분 문제별 최종 상태들을 합쳐 전체 문제의 최종 상태를 차례로 생성합니다
+    
+    부분 문제마다 최종 상태 하나씩을 고른 모든 조합에 대해, interleave가 True이면
+    각 부분 문제의 조립 순서를 유지한 채 섞는 모든 순서(interleaving)마다 최종 상태를 하나씩 생성합니다.
+    공통 접두사의 상태는 공유하며 필요한 만큼만 만들어지므로, 호출자는 원하는 시점에 중단할 수 있습니다.
+    트리 탐색 결과를 합치면 전체 문제를 search_algorithm_BFS로 탐색한 결과와
+    같은 (조립 결과, 조립 순서) 집합을 얻습니다 (생성 순서는 다름).
+    interleave가 False이면 조합마다 부분 문제 순서대로 이어 붙인 조립 순서 하나만 생성하므로,
+    그래프 탐색 결과를 합쳐 서로 다른 최종 조립 결과를 얻을 때 사용합니다.
+    
+    Args:
+        init_state_arg: 전체 문제의 초기 상태
+        component_final_state_list_list: 부분 문제별 최종 상태 리스트 (search_algorithm_decomposed_BFS 결과)
+        interleave: 부분 문제 조립 순서를 섞는 모든 순서를 생성할지 여부 (기본값: True)
+        
+    Yields:
+        전체 문제의 최종 상태 (action_sequence_log에 합쳐진 조립 순서가 기록됨)
+    """
+    for final_state_combination in itertools.product(*component_final_state_list_list):
+        action_sequence_list: list[list[list[tuple[UUID, int]]]] = [
+            final_state.get_action_sequence_log() for final_state in final_state_combination]
+        if not interleave:
+            current_state: State = init_state_arg
+            for match_info in itertools.chain.from_iterable(action_sequence_list):
+                current_state = execute_assemble(current_state, match_info)
+            yield current_state
+            continue
+        
+        # (상태, 부분 문제별 다음 조립 위치): 스택으로 모든 interleaving을 깊이 우선 생성
+        stack: list[tuple[State, tuple[int, ...]]] = [(init_state_arg, (0,) * len(action_sequence_list))]
+        while stack:
+            current_state, position_tuple = stack.pop()
+            next_list: list[tuple[State, tuple[int, ...]]] = []
+            for component_index, action_sequence in enumerate(action_sequence_list):
+                position: int = position_tuple[component_index]
+                if position < len(action_sequence):
+                    next_list.append((execute_assemble(current_state, action_sequence[position]),
+                                      (*position_tuple[:component_index], position + 1,
+                                       *position_tuple[component_index + 1:])))
+            if len(next_list) == 0:
+                yield current_state
+            # 앞쪽 부분 문제를 먼저 진행하는 순서가 먼저 생성되도록 역순으로 추가
+            stack.extend(reversed(next_list))
+
+
+def count_decomposed_assembly_plans(init_state_arg: State, assembly_data_base: AssemblyGroupDataBase,
+                                    observer: SearchObserver | None = None,
+                                    symmetry_reduction: bool = False) -> int:
+    """독립 부분 문제별로 조립 순서를 센 뒤, 섞는 순서의 수를 곱해 전체 조립 순서 수를 계산합니다
+    
+    부분 문제마다 count_assembly_plans(per_terminal=True)로 최종 상태별 조립 순서 수를 구하고
+    조립 횟수(길이)별 개수로 모읍니다. 길이가 a, b인 두 조립 순서를 섞는 방법은 C(a+b, a)가지이므로
+    부분 문제들의 길이별 개수를 이항계수로 합성곱하여 합칩니다.
+    결과는 전체 문제에 count_assembly_plans를 적용한 값과 같습니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        assembly_data_base: 조립 규칙 데이터베이스
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        symmetry_reduction: 부분 문제 계산에 대칭 감소 사용 여부 (기본값: False, 결과는 같음)
+        
+    Returns:
+        전체 조립 순서 수
+    """
+    # 조립 횟수 -> 조립 순서 수 (부분 문제가 없으면 아무것도 조립하지 않는 순서 1개)
+    length_count_dict: dict[int, int] = {0: 1}
+    for subproblem_init_state in decompose_independent_subproblem(init_state_arg, assembly_data_base):
+        sub_layout: StateLayout = subproblem_init_state.layout
+        group_arity_list: list[int] = sub_layout.get_compiled_problem(assembly_data_base).group_arity_list
+        terminal_count_dict: dict[int, int] = count_assembly_plans(
+            subproblem_init_state, assembly_data_base, per_terminal=True, observer=observer,
+            symmetry_reduction=symmetry_reduction)
+        
+        sub_length_count_dict: dict[int, int] = {}
+        for terminal_mask, plan_count in terminal_count_dict.items():
+            # 최종 상태의 조립 횟수: main_type별 새로 조립된 조립부 수 / 조립 한 번의 조립부 수
+            group_port_count_dict: dict[int, int] = {}
+            added_mask: int = terminal_mask & ~subproblem_init_state.get_assembled_mask()
+            for port_bit in range(added_mask.bit_length()):
+                if added_mask >> port_bit & 1:
+                    main_type_id: int = sub_layout.port_main_type_list[port_bit]
+                    group_port_count_dict[main_type_id] = group_port_count_dict.get(main_type_id, 0) + 1
+            plan_length: int = sum(port_count // group_arity_list[main_type_id]
+                                   for main_type_id, port_count in group_port_count_dict.items())
+            sub_length_count_dict[plan_length] = sub_length_count_dict.get(plan_length, 0) + plan_count
+        
+        combined_length_count_dict: dict[int, int] = {}
+        for length, count in length_count_dict.items():
+            for sub_length, sub_count in sub_length_count_dict.items():
+                combined_length_count_dict[length + sub_length] = (
+                    combined_length_count_dict.get(length + sub_length, 0)
+                    + count * sub_count * math.comb(length + sub_length, length))
+        length_count_dict = combined_length_count_dict
+    
+    return sum(length_count_dict.values())
+
+
+def get_goal_port_mask(state_arg: State, goal_arg: State | Iterable[str | tuple[UUID, int]]) -> int:
+    """목표 조건을 조립부 비트마스크로 변환합니다
+    
+    목표는 다음 중 하나로 지정할 수 있습니다.
+    - State: 해당 상태에서 조립에 사용된 모든 조립부
+    - main_type 문자열: 해당 main_type을 가진 모든 조립부
+    - (UUID, assembly_type_index) 튜플: 특정 조립부
+    
+    Args:
+        state_arg: 부품 구조를 참조할 상태
+        goal_arg: 목표 상태 또는 반드시 조립되어야 하는 그룹/조립부의 모음
+        
+    Returns:
+        목표 상태에서 조립에 사용되어 있어야 하는 조립부 비트마스크
+    """
+    if isinstance(goal_arg, State):
+        return goal_arg.get_assembled_mask()
+    
+    layout: StateLayout = state_arg.layout
+    goal_mask: int = 0
+    for goal_element in goal_arg:
+        if isinstance(goal_element, str):
+            main_type_id: int | None = layout.main_type_id_dict.get(goal_element)
+            if main_type_id is None:
+                continue
+            for port_list in layout.port_index[main_type_id].values():
+                for port_bit in port_list:
+                    goal_mask |= 1 << port_bit
+        else:
+            item_uuid, assembly_type_index = goal_element
+            goal_mask |= 1 << layout.get_port_bit(item_uuid, assembly_type_index)
+    return goal_mask
+
+
+def estimate_remaining_assemble_count(state_arg: State, goal_mask: int, 
+                                      assembly_data_base: AssemblyGroupDataBase) -> float:
+    """목표까지 남은 최소 조립 횟수를 추정합니다 (A* 휴리스틱)
+    
+    하나의 조립은 한 main_type 그룹의 조립부를 정확히 그룹 크기만큼만 사용하므로,
+    main_type별 미충족 조립부 개수를 그룹 크기로 나눈 값(올림)의 합은
+    실제 남은 조립 횟수를 넘지 않습니다 (admissible).
+    
+    Args:
+        state_arg: 현재 상태
+        goal_mask: 목표 조립부 비트마스크
+        assembly_data_base: 조립 규칙 데이터베이스
+        
+    Returns:
+        남은 최소 조립 횟수. 조립 규칙이 없는 조립부가 목표에 남아 있으면 inf
+    """
+    unsatisfied_mask: int = goal_mask & ~state_arg.get_assembled_mask()
+    port_main_type_list: list[int] = state_arg.layout.port_main_type_list
+    unsatisfied_count_dict: dict[int, int] = {}
+    while unsatisfied_mask:
+        lowest_bit: int = unsatisfied_mask & -unsatisfied_mask
+        main_type_id: int = port_main_type_list[lowest_bit.bit_length() - 1]
+        unsatisfied_count_dict[main_type_id] = unsatisfied_count_dict.get(main_type_id, 0) + 1
+        unsatisfied_mask ^= lowest_bit
+    
+    group_arity_list: list[int] = state_arg.layout.get_compiled_problem(assembly_data_base).group_arity_list
+    remaining_assemble_count: int = 0
+    for main_type_id, unsatisfied_count in unsatisfied_count_dict.items():
+        group_arity: int = group_arity_list[main_type_id]
+        if group_arity == 0:
+            # 조립 규칙이 없으므로 목표 달성 불가
+            return float("inf")
+        remaining_assemble_count += -(-unsatisfied_count // group_arity)
+    return remaining_assemble_count
+
+
+def search_algorithm_A_star(init_state_arg: State, goal_state_arg: State | Iterable[str | tuple[UUID, int]] | None,
+                            assembly_data_base: AssemblyGroupDataBase,
+                            observer: SearchObserver | None = None,
+                            successor_cache: SuccessorCache | None = None) -> list[State]:
+    """A* 탐색으로 목표를 만족하는 최단 조립 계획 하나를 찾습니다
+    
+    조립 횟수를 비용으로 하고, estimate_remaining_assemble_count를 휴리스틱으로
+    사용하는 우선순위 큐 기반 탐색입니다. 같은 상태(get_state_key)는
+    더 적은 조립 횟수로 도달한 경우에만 다시 확장합니다.
+    휴리스틱이 admissible하므로 처음 꺼낸 목표 상태가 최소 조립 횟수 계획입니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 (get_goal_port_mask 참고).
+            None이면 더 이상 조립이 불가능한 최종 상태를 목표로 합니다.
+        assembly_data_base: 조립 규칙 데이터베이스
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Returns:
+        목표를 만족하는 최종 상태 1개를 담은 리스트 (계획이 없으면 빈 리스트).
+        최종 상태의 action_sequence_log가 조립 계획입니다.
+    """
+    goal_mask: int = 0 if goal_state_arg is None else get_goal_port_mask(init_state_arg, goal_state_arg)
+    
+    # (f = g + h, g, 삽입 순서, 상태): 삽입 순서로 동점 시 먼저 넣은 상태를 우선
+    frontier: list[tuple[float, int, int, State]] = []
+    best_cost_dict: dict[int, int] = {init_state_arg.get_state_key(): 0}
+    push_count: int = 0
+    init_heuristic: float = estimate_remaining_assemble_count(init_state_arg, goal_mask, assembly_data_base)
+    if init_heuristic != float("inf"):
+        heapq.heappush(frontier, (init_heuristic, 0, push_count, init_state_arg))
+    
+    explored_count: int = 0
+    exploration_limit: int = 10000000# 무한 반복 한계 설정
+    
+    while frontier:
+        _, cost, _, current_state = heapq.heappop(frontier)
+        if cost > best_cost_dict[current_state.get_state_key()]:
+            # 더 짧은 경로로 이미 확장된 상태
+            continue
+        explored_count += 1
+        if explored_count >= exploration_limit:
+            break
+        
+        if observer is not None:
+            observer.on_state_expanded(current_state)
+        candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(
+            current_state, assembly_data_base, observer, successor_cache)
+        
+        if goal_state_arg is None:
+            goal_reached: bool = len(candidate_match_list) == 0
+        else:
+            goal_reached = goal_mask & ~current_state.get_assembled_mask() == 0
+        if goal_reached:
+            if observer is not None:
+                observer.on_final_state(current_state, explored_count)
+            print(f"A* 완료: 총 {explored_count}개 상태 탐색, "
+                  f"조립 단계 수: {current_state.get_depth()}")
+            return [current_state]
+        
+        for match_info in candidate_match_list:
+            new_state: State = observe_execute_assemble(current_state, match_info, observer)
+            state_key: int = new_state.get_state_key()
+            new_cost: int = cost + 1
+            if best_cost_dict.get(state_key, new_cost + 1) <= new_cost:
+                if observer is not None:
+                    observer.on_duplicate_state(current_state, match_info)
+                continue
+            heuristic: float = estimate_remaining_assemble_count(new_state, goal_mask, assembly_data_base)
+            if heuristic == float("inf"):
+                continue
+            best_cost_dict[state_key] = new_cost
+            push_count += 1
+            heapq.heappush(frontier, (new_cost + heuristic, new_cost, push_count, new_state))
+    
+    print(f"A* 완료: 총 {explored_count}개 상태 탐색, 목표를 만족하는 계획 없음")
+    return []
+
+
+def iterate_search_DFS(init_state_arg: State, goal_state_arg: State | Iterable[str | tuple[UUID, int]] | None,
+                       assembly_data_base: AssemblyGroupDataBase,
+                       depth_limit: int | None = None, observer: SearchObserver | None = None,
+                       successor_cache: SuccessorCache | None = None) -> Iterator[State]:
+    """DFS를 사용하여 조립 경로를 탐색하고, 목표 상태를 발견 즉시 생성합니다
+    
+    탐색 스택에는 깊이마다 자식 상태를 하나씩 만들어 내는 iterate_successor만 쌓이므로,
+    메모리 사용량은 BFS처럼 한 깊이의 전체 상태 수가 아니라 계획 깊이에 비례합니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 (get_goal_port_mask 참고).
+            None이면 더 이상 조립이 불가능한 모든 최종 상태를 생성합니다.
+        assembly_data_base: 조립 규칙 데이터베이스
+        depth_limit: 최대 조립 단계 수 (None이면 제한 없음)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Yields:
+        목표를 만족하는 상태 (goal_state_arg가 None이면 최종 상태)
+    """
+    goal_mask: int | None = None if goal_state_arg is None else get_goal_port_mask(init_state_arg, goal_state_arg)
+    search_info: dict[str, int | bool] = {}
+    for state in _iterate_depth_limited_DFS(init_state_arg, goal_mask, assembly_data_base, depth_limit, search_info,
+                                            observer, successor_cache):
+        yield state
+    print(f"\nDFS 완료: 총 {search_info['explored_count']}개 상태 탐색, {search_info['found_count']}개 상태 발견")
+
+
+def search_algorithm_DFS(init_state_arg: State, goal_state_arg: State | Iterable[str | tuple[UUID, int]] | None,
+                         assembly_data_base: AssemblyGroupDataBase,
+                         depth_limit: int | None = None, observer: SearchObserver | None = None,
+                         successor_cache: SuccessorCache | None = None) -> list[State]:
+    """DFS를 사용하여 목표 상태(또는 최종 상태)를 모두 찾아 리스트로 반환합니다
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 (iterate_search_DFS 참고)
+        assembly_data_base: 조립 규칙 데이터베이스
+        depth_limit: 최대 조립 단계 수 (None이면 제한 없음)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Returns:
+        iterate_search_DFS가 생성한 상태들의 리스트
+    """
+    return list(iterate_search_DFS(init_state_arg, goal_state_arg, assembly_data_base, depth_limit=depth_limit,
+                                   observer=observer, successor_cache=successor_cache))
+
+
+def search_algorithm_IDDFS(init_state_arg: State, goal_state_arg: State | Iterable[str | tuple[UUID, int]] | None,
+                           assembly_data_base: AssemblyGroupDataBase,
+                           max_depth: int | None = None, observer: SearchObserver | None = None,
+                           successor_cache: SuccessorCache | None = None) -> list[State]:
+    """반복 깊이 증가 DFS(IDDFS)로 조립 단계 수가 가장 적은 계획 하나를 찾습니다
+    
+    깊이 제한을 0부터 1씩 늘려가며 DFS를 반복하므로, BFS처럼 최소 조립 단계
+    계획을 찾으면서도 메모리는 DFS와 같이 계획 깊이에만 비례합니다.
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_state_arg: 목표 (get_goal_port_mask 참고).
+            None이면 더 이상 조립이 불가능한 최종 상태를 목표로 합니다.
+        assembly_data_base: 조립 규칙 데이터베이스
+        max_depth: 시도할 최대 깊이 제한 (None이면 더 깊은 상태가 없을 때까지)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음).
+            깊이 제한마다 다시 확장하는 상태도 매번 집계됩니다.
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음).
+            깊이 제한마다 같은 상태를 다시 확장하므로 캐시의 효과가 큽니다.
+        
+    Returns:
+        목표를 만족하는 상태 1개를 담은 리스트 (계획이 없으면 빈 리스트)
+    """
+    goal_mask: int | None = None if goal_state_arg is None else get_goal_port_mask(init_state_arg, goal_state_arg)
+    depth_limit: int = 0
+    total_explored_count: int = 0
+    
+    while max_depth is None or depth_limit <= max_depth:
+        search_info: dict[str, int | bool] = {}
+        for state in _iterate_depth_limited_DFS(init_state_arg, goal_mask, assembly_data_base, depth_limit, search_info,
+                                                observer, successor_cache):
+            total_explored_count += search_info["explored_count"]
+            print(f"IDDFS 완료: 총 {total_explored_count}개 상태 탐색, 조립 단계 수: {depth_limit}")
+            return [state]
+        total_explored_count += search_info["explored_count"]
+        if not search_info["cutoff"]:
+            # 깊이 제한으로 잘린 상태가 없음: 더 깊이 탐색해도 결과가 같음
+            break
+        depth_limit += 1
+    
+    print(f"IDDFS 완료: 총 {total_explored_count}개 상태 탐색, 목표를 만족하는 계획 없음")
+    return []
+
+
+def _iterate_depth_limited_DFS(init_state_arg: State, goal_mask: int | None, 
+                               assembly_data_base: AssemblyGroupDataBase, depth_limit: int | None,
+                               search_info: dict[str, int | bool],
+                               observer: SearchObserver | None = None,
+                               successor_cache: SuccessorCache | None = None) -> Iterator[State]:
+    """깊이 제한 DFS를 수행합니다 (iterate_search_DFS, search_algorithm_IDDFS 공용)
+    
+    Args:
+        init_state_arg: 초기 상태
+        goal_mask: 목표 조립부 비트마스크 (None이면 최종 상태가 목표)
+        assembly_data_base: 조립 규칙 데이터베이스
+        depth_limit: 최대 조립 단계 수 (None이면 제한 없음)
+        search_info: 탐색 결과를 기록할 딕셔너리
+            (explored_count: 탐색 상태 수, found_count: 발견 상태 수, cutoff: 깊이 제한으로 잘린 상태 존재 여부)
+        observer: 탐색 이벤트를 전달받을 관찰자 (None이면 사용하지 않음)
+        successor_cache: 조립 후보 리스트를 재사용할 캐시 (None이면 사용하지 않음)
+        
+    Yields:
+        목표를 만족하는 상태
+    """
+    search_info.update(explored_count=0, found_count=0, cutoff=False)
+    exploration_limit: int = 10000000# 무한 반복 한계 설정
+    
+    # 스택의 각 원소는 해당 깊이에서 아직 방문하지 않은 형제 상태들을 생성하는 iterator
+    stack: list[Iterator[State]] = [iter([init_state_arg])]
+    
+    while stack:
+        current_state: State | None = next(stack[-1], None)
+        if current_state is None:
+            stack.pop()
+            continue
+        
+        search_info["explored_count"] += 1
+        if search_info["explored_count"] >= exploration_limit:
+            break
+        
+        if goal_mask is not None and goal_mask & ~current_state.get_assembled_mask() == 0:
+            search_info["found_count"] += 1
+            if observer is not None:
+                observer.on_final_state(current_state, search_info["explored_count"])
+            yield current_state
+            continue
+        
+        if observer is not None:
+            observer.on_state_expanded(current_state)
+        candidate_match_list: list[list[tuple[UUID, int]]] = observe_candidate_match(
+            current_state, assembly_data_base, observer, successor_cache)
+        if len(candidate_match_list) == 0:
+            if goal_mask is None:
+                search_info["found_count"] += 1
+                if observer is not None:
+                    observer.on_final_state(current_state, search_info["explored_count"])
+                yield current_state
+            continue
+        
+        if depth_limit is not None and len(stack) > depth_limit:
+            # 현재 상태의 깊이(len(stack) - 1)가 제한에 도달: 더 이상 확장하지 않음
+            search_info["cutoff"] = True
+            continue
+        
+        stack.append(child_state for _, child_state
+                     in iterate_successor(current_state, assembly_data_base, candidate_match_list, observer))
+
+
+def generate_synthetic_problem(item_count: int, port_per_item: int = 2, group_arity: int = 2,
+                               conflict_ratio: float = 0.0, main_type_count: int | None = None,
+                               seed: int = 0) -> tuple[list[Item], AssemblyGroupDataBase]:
+    """벤치마크용 조립 문제(부품 리스트, 조립 규칙 데이터베이스)를 무작위로 생성합니다
+    
+    main_type마다 group_arity개의 sub_type으로 이루어진 조립 그룹을 만들고
+    (2개: m, f / 3개: m, i, f / 그 이상: m, i1, i2, ..., f),
+    각 부품에는 서로 다른 main_type의 조립부를 port_per_item개씩 붙입니다.
+    같은 seed에 대해서는 항상 같은 문제(부품 UUID 포함)를 생성합니다.
+    
+    Args:
+        item_count: 부품 개수
+        port_per_item: 부품당 조립부 개수
+        group_arity: 조립 그룹 하나에 필요한 조립부 개수 (예: 문 예제의 B, D 그룹은 3)
+        conflict_ratio: 조립 규칙에 없는 sub_type을 갖는(어떤 그룹에도 쓰일 수 없는) 조립부의 비율 (0.0 ~ 1.0)
+        main_type_count: main_type 개수 (None이면 조립부들이 평균 2개 그룹을 채울 수 있도록 자동 결정)
+        seed: 난수 시드
+        
+    Returns:
+        (부품 리스트, 조립 규칙 데이터베이스)
+    """
+    random_generator = random.Random(seed)
+    if main_type_count is None:
+        main_type_count = max(1, item_count * port_per_item // (group_arity * 2))
+    port_per_item = min(port_per_item, main_type_count)
+    
+    if group_arity <= 2:
+        sub_type_list: list[str] = ["m", "f"][:max(group_arity, 1)]
+    elif group_arity == 3:
+        sub_type_list = ["m", "i", "f"]
+    else:
+        sub_type_list = ["m"] + [f"i{index}" for index in range(1, group_arity - 1)] + ["f"]
+    
+    assembly_data_base = AssemblyGroupDataBase()
+    main_type_list: list[str] = [f"T{index}" for index in range(main_type_count)]
+    for main_type in main_type_list:
+        assembly_data_base.add_assembly_type_group([AssemblyType(main_type, sub_type) for sub_type in sub_type_list])
+    
+    item_list: list[Item] = []
+    for item_index in range(item_count):
+        item = Item(f"item_{item_index}")
+        for main_type in random_generator.sample(main_type_list, port_per_item):
+            if random_generator.random() < conflict_ratio:
+                sub_type = "x"  # 조립 규칙에 없는 sub_type: 충돌 조립부
+            else:
+                sub_type = random_generator.choice(sub_type_list)
+            item.add_type(AssemblyType(main_type, sub_type))
+        item_list.append(item)
+    assign_deterministic_uuid(item_list)
+    
+    return item_list, assembly_data_base
+
+
+BENCHMARK_SEARCH_MODE_LIST: list[str] = [
+    "check_candidate_match", "execute_assemble",
+    "BFS", "BFS_graph", "BFS_POR", "parallel_BFS", "A_star", "DFS", "IDDFS", "beam", "count",
+]
+
+
+def _run_benchmark_search_mode(item_list: list[Item], assembly_data_base: AssemblyGroupDataBase,
+                               search_mode: str, repeat_count: int) -> int:
+    """search_mode 하나를 새 초기 상태에서 실행하고, 확장한 상태(또는 호출) 수를 반환합니다"""
+    init_state: State = State(item_list)
+    
+    if search_mode == "check_candidate_match":
+        # 상태별 후보 캐시를 피하기 위해 매번 같은 마스크의 새 상태에서 계산
+        for _ in range(repeat_count):
+            check_candidate_match(init_state.create_state_from_mask(init_state.get_assembled_mask()),
+                                  assembly_data_base)
+        return repeat_count
+    if search_mode == "execute_assemble":
+        candidate_match_list = check_candidate_match(init_state, assembly_data_base)
+        for repeat_index in range(repeat_count if candidate_match_list else 0):
+            execute_assemble(init_state, candidate_match_list[repeat_index % len(candidate_match_list)])
+        return repeat_count if candidate_match_list else 0
+    
+    search_metrics = SearchMetrics()
+    if search_mode == "BFS":
+        search_algorithm_BFS(init_state, None, assembly_data_base, observer=search_metrics)
+    elif search_mode == "BFS_graph":
+        search_algorithm_BFS(init_state, None, assembly_data_base, graph_search=True, observer=search_metrics)
+    elif search_mode == "BFS_POR":
+        search_algorithm_BFS(init_state, None, assembly_data_base, graph_search=True,
+                             partial_order_reduction=True, observer=search_metrics)
+    elif search_mode == "parallel_BFS":
+        search_algorithm_parallel_BFS(init_state, None, assembly_data_base, observer=search_metrics)
+    elif search_mode == "A_star":
+        search_algorithm_A_star(init_state, None, assembly_data_base, observer=search_metrics)
+    elif search_mode == "DFS":
+        search_algorithm_DFS(init_state, None, assembly_data_base, observer=search_metrics)
+    elif search_mode == "IDDFS":
+        search_algorithm_IDDFS(init_state, None, assembly_data_base, observer=search_metrics)
+    elif search_mode == "beam":
+        search_algorithm_beam(init_state, None, assembly_data_base, observer=search_metrics)
+    elif search_mode == "count":
+        count_assembly_plans(init_state, assembly_data_base, observer=search_metrics)
+    else:
+        raise ValueError(f"알 수 없는 search_mode: {search_mode}")
+    return search_metrics.expanded_state_count
+
+
+def benchmark_search_mode(item_list: list[Item], assembly_data_base: AssemblyGroupDataBase,
+                          search_mode: str, repeat_count: int = 1000,
+                          measure_memory: bool = True) -> dict[str, float]:
+    """한 문제에 대해 search_mode 하나의 수행 시간, 처리량, 최대 메모리를 측정합니다
+    
+    탐색 함수의 출력은 측정에서 제외합니다. 메모리 측정(tracemalloc)은 수행 시간을
+    늘리므로, 시간 측정과 분리하여 한 번 더 실행합니다.
+    
+    Args:
+        item_list: 부품 리스트
+        assembly_data_base: 조립 규칙 데이터베이스
+        search_mode: BENCHMARK_SEARCH_MODE_LIST 중 하나.
+            check_candidate_match, execute_assemble은 초기 상태에서 repeat_count번 호출하고,
+            나머지는 목표 없이(최종 상태까지) 해당 탐색을 한 번 수행합니다.
+        repeat_count: check_candidate_match, execute_assemble 반복 횟수
+        measure_memory: 최대 메모리 사용량을 측정할지 여부
+        
+    Returns:
+        {"state_count": 확장한 상태 수(또는 호출 수), "wall_time": 수행 시간(초),
+         "states_per_sec": 초당 상태 수, "peak_memory": 최대 메모리 사용량(바이트, 미측정 시 0)}
+    """
+    with contextlib.redirect_stdout(io.StringIO()):
+        start_time: float = time.perf_counter()
+        state_count: int = _run_benchmark_search_mode(item_list, assembly_data_base, search_mode, repeat_count)
+        wall_time: float = time.perf_counter() - start_time
+        
+        peak_memory: int = 0
+        if measure_memory:
+            tracemalloc.start()
+            try:
+                _run_benchmark_search_mode(item_list, assembly_data_base, search_mode, repeat_count)
+                _, peak_memory = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+    
+    return {"state_count": state_count, "wall_time": wall_time,
+            "states_per_sec": state_count / wall_time if wall_time > 0 else float("inf"),
+            "peak_memory": peak_memory}
+
+
+def run_scaling_benchmark(item_count_list: Iterable[int] = (4, 6, 8, 10), port_per_item: int = 2,
+                          group_arity: int = 2, conflict_ratio: float = 0.0,
+                          search_mode_list: Iterable[str] | None = None, seed: int = 0,
+                          measure_memory: bool = True) -> list[dict[str, float | int | str]]:
+    """부품 개수를 늘려가며 각 search_mode의 확장성(scaling curve)을 측정하고 표로 출력합니다
+    
+    부품 개수 외의 문제 조건(port_per_item, group_arity, conflict_ratio)은 고정되므로,
+    다른 조건에 대한 곡선은 해당 인자를 바꿔 다시 호출하여 얻습니다.
+    트리 탐색(BFS)은 계획 수에 비례하여 급격히 느려지므로 작은 문제부터 측정하십시오.
+    
+    Args:
+        item_count_list: 측정할 부품 개수들
+        port_per_item: 부품당 조립부 개수
+        group_arity: 조립 그룹 하나에 필요한 조립부 개수
+        conflict_ratio: 충돌 조립부 비율 (generate_synthetic_problem 참고)
+        search_mode_list: 측정할 search_mode들 (None이면 트리 BFS와 병렬 BFS를 제외한 전체)
+        seed: 문제 생성 난수 시드
+        measure_memory: 최대 메모리 사용량을 측정할지 여부
+        
+    Returns:
+        측정 결과 행의 리스트. 각 행은 benchmark_search_mode의 결과에
+        search_mode, item_count, port_count를 더한 딕셔너리입니다.
+    """
+    if search_mode_list is None:
+        search_mode_list = [search_mode for search_mode in BENCHMARK_SEARCH_MODE_LIST
+                            if search_mode not in ("BFS", "parallel_BFS")]
+    search_mode_list = list(search_mode_list)
+    
+    result_list: list[dict[str, float | int | str]] = []
+    print(f"{'search_mode':<22}{'items':>6}{'ports':>7}{'states':>10}{'time(s)':>10}{'states/s':>12}{'peak(KiB)':>11}")
+    for item_count in item_count_list:
+        item_list, assembly_data_base = generate_synthetic_problem(item_count, port_per_item, group_arity,
+                                                                   conflict_ratio, seed=seed)
+        port_count: int = sum(len(item.get_type_list()) for item in item_list)
+        for search_mode in search_mode_list:
+            result = benchmark_search_mode(item_list, assembly_data_base, search_mode, measure_memory=measure_memory)
+            result.update(search_mode=search_mode, item_count=item_count, port_count=port_count)
+            result_list.append(result)
+            print(f"{search_mode:<22}{item_count:>6}{port_count:>7}{result['state_count']:>10}"
+                  f"{result['wall_time']:>10.4f}{result['states_per_sec']:>12.0f}{result['peak_memory'] / 1024:>11.1f}")
+    
+    return result_list
+
+
+def print_state_action_sequence_log(state: State) -> None:
+    """조립 계획 시퀀스를 출력합니다
+    
+    각 조립 단계별로 어떤 부품들이 어떤 타입으로 조립되는지 출력합니다.
+    
+    Args:
+        state: 출력할 상태 객체
+    """
+    action_sequence_log: list[list[tuple[UUID, int]]] = state.get_action_sequence_log()
+    
+    if len(action_sequence_log) == 0:
+        print("[조립 단계 0]")
+        print("아직까지 수행된 조립 없음")
+    else:
+        for planning_step, match in enumerate(action_sequence_log):
+            print(f"[조립 단계 {planning_step + 1}]")
+            for item_uuid, assembly_type_index in match:
+                item = state.get_item_by_uuid(item_uuid)
+                print("부품 이름:", item.name)
+                assembly_type = item.get_type_by_index(assembly_type_index)
+                main_type, sub_type = assembly_type.get_type()
+                print(f"  └─> 매칭 타입: {main_type}-{sub_type}")
+            print("-----")
+
+
+def print_match_info_list(state: State, match_info_list: list[list[tuple[UUID, int]]]) -> None:
+    """매칭 정보 리스트를 출력합니다
+    
+    Args:
+        state: 현재 상태
+        match_info_list: 출력할 매칭 정보 리스트
+    """
+    for match_index, match_set in enumerate(match_info_list):
+        print("--매칭[{}]--".format(match_index))
+        for item_uuid, index in match_set:
+            candidate_item = state.get_item_by_uuid(item_uuid)
+            assembly_type = candidate_item.get_type_by_index(index)
+            print("item: {:15}, assembly_main_type: {}, assembly_sub_type: {}".format(
+                candidate_item.name, assembly_type.main_type, assembly_type.sub_type))
+
+
+def print_match_info(state: State, match_info: list[tuple[UUID, int]]) -> None:
+    """매칭 정보를 출력합니다
+    
+    Args:
+        state: 현재 상태
+        match_info: 출력할 매칭 정보
+    """
+    for item_uuid, index in match_info:
+        candidate_item = state.get_item_by_uuid(item_uuid)
+        assembly_type = candidate_item.get_type_by_index(index)
+        print("item: {:15}, assembly_main_type: {}, assembly_sub_type: {}".format(
+            candidate_item.name, assembly_type.main_type, assembly_type.sub_type))
+
+
+def main() -> None:
+    """메인 함수: 조립 계획 시스템 데모"""
+    
+    # ========================================
+    # 1. 데이터 생성 단계
+    # ========================================
+    
+    # --- 1-1. 조립 타입 데이터 생성 ---
+    type_A_m = AssemblyType(main_type_arg="A", sub_type_arg="m")
+    type_A_f = AssemblyType(main_type_arg="A", sub_type_arg="f")
+
+    type_B_m = AssemblyType(main_type_arg="B", sub_type_arg="m")
+    type_B_i = AssemblyType(main_type_arg="B", sub_type_arg="i")
+    type_B_f = AssemblyType(main_type_arg="B", sub_type_arg="f")
+    
+    type_C_m = AssemblyType(main_type_arg="C", sub_type_arg="m")
+    type_C_f = AssemblyType(main_type_arg="C", sub_type_arg="f")
+
+    type_D_m = AssemblyType(main_type_arg="D", sub_type_arg="m")
+    type_D_i = AssemblyType(main_type_arg="D", sub_type_arg="i")
+    type_D_f = AssemblyType(main_type_arg="D", sub_type_arg="f")
 
     type_E_m = AssemblyType(main_type_arg="E", sub_type_arg="m")
     type_E_f = AssemblyType(main_type_arg="E", sub_type_arg="f")
@@ -595,7 +3675,7 @@ def main() -> None:
     
     # --- 2-1. 조립 계획(Planning) 수행 ---
     print("---< Planning 시작 >---\n")
-    final_state_list = search_algorithm_BFS(init_state, None, assembly_data_base)
+    final_state_list = search_algorithm_BFS(init_state, None, assembly_data_base, observer=PrintSearchObserver())
     print("\n---< Planning 종료 >---")
 
     # --- 2-2. 결과 출력 ---
@@ -632,4 +3712,7 @@ def main() -> None:
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    if len(sys.argv) > 1 and sys.argv[1] == "benchmark":
+        run_scaling_benchmark()
+    else:
+        main()
\ No newline at end of file